@@ -2,17 +2,105 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from pserver_manager.models import Game, GameVersion, Server, ServerStatus
+from pserver_manager.models import Game, GameVersion, Server, ServerStatus, UpdatesConfig
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _Loader is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; falling back to the slower pure-Python loader")
+
+# Bundled game definitions, which scripts/compile_configs.py can precompile
+_BUNDLED_GAMES_DIR = Path(__file__).parent / "config" / "games"
+
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_LOAD_THRESHOLD = 8
+
+# Maximum number of parsed files kept in memory, keyed by content hash
+_PARSE_CACHE_SIZE = 2048
+
+# Snapshot of every parsed server file, relative to the cache directory
+_SERVERS_SNAPSHOT = "servers_snapshot.json"
+
+# Identical GameVersion values are shared across games and reloads
+_version_cache: dict[GameVersion, GameVersion] = {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value, passing non-strings through unchanged.
+
+    Args:
+        value: Value from YAML
+
+    Returns:
+        Interned string or the original value
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _shared_version(version: GameVersion) -> GameVersion:
+    """Return the shared instance equal to a game version.
+
+    Args:
+        version: Newly built game version
+
+    Returns:
+        Previously seen equal GameVersion, or version itself
+    """
+    return _version_cache.setdefault(version, version)
+
+
+@functools.lru_cache(maxsize=128)
+def _make_game(id: str, name: str, icon: str, versions: tuple[GameVersion, ...]) -> Game:
+    """Build a Game model, reusing the instance for identical definitions.
+
+    Game is frozen and its fields are hashable, so reloading an unchanged
+    game definition hands the sidebar the very same Game object.
+    """
+    return Game(id=id, name=name, icon=icon, versions=versions)
+
+
+def _scan_yaml_files(directory: Path) -> list[Path]:
+    """List YAML files in a directory with a single scandir pass.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Paths of *.yaml files (empty if the directory doesn't exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                directory / entry.name
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 class ColumnDefinition:
     """Table column definition."""
 
+    __slots__ = ("id", "label", "width")
+
     def __init__(self, id: str, label: str, width: str):
         """Initialize column definition.
 
@@ -29,48 +117,117 @@ class ColumnDefinition:
 class GameDefinition:
     """Game definition loaded from YAML."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "icon",
+        "reddit",
+        "updates_url",
+        "updates_is_rss",
+        "updates_use_js",
+        "updates_selectors",
+        "updates_max_dropdown_options",
+        "updates_limit",
+        "updates_forum_mode",
+        "updates_forum_pagination_selector",
+        "updates_forum_page_limit",
+        "updates_fetch_thread_content",
+        "updates_thread_content_selector",
+        "updates_auto_detect_date",
+        "updates_wiki_mode",
+        "updates_wiki_link_selector",
+        "updates_wiki_content_selector",
+        "server_schema",
+        "_versions_raw",
+        "_versions",
+        "_columns_raw",
+        "_columns",
+    )
+
     def __init__(self, data: dict[str, Any]):
         """Initialize game definition.
 
         Args:
             data: Game definition data from YAML
         """
+        get = data.get  # Bound once; runs for every game on each load
         self.id: str = data["id"]
         self.name: str = data["name"]
-        self.icon: str = data.get("icon", "")
-        self.reddit: str = data.get("reddit", "")
-        self.updates_url: str = data.get("updates_url", "")
-        self.updates_is_rss: bool = data.get("updates_is_rss", False)
-        self.updates_use_js: bool = data.get("updates_use_js", False)
-        self.updates_selectors: dict[str, str] = data.get("updates_selectors", {})
-        self.updates_max_dropdown_options: int | None = data.get("updates_max_dropdown_options")
-        self.updates_limit: int = data.get("updates_limit", 10)
-        self.updates_forum_mode: bool = data.get("updates_forum_mode", False)
-        self.updates_forum_pagination_selector: str = data.get("updates_forum_pagination_selector", ".ipsPagination_next")
-        self.updates_forum_page_limit: int = data.get("updates_forum_page_limit", 1)
-        self.updates_fetch_thread_content: bool = data.get("updates_fetch_thread_content", False)
-        self.updates_thread_content_selector: str = data.get("updates_thread_content_selector", "")
-        self.updates_wiki_mode: bool = data.get("updates_wiki_mode", False)
-        self.updates_wiki_link_selector: str = data.get("updates_wiki_link_selector", "a[href*='/wiki/Updates/']")
-        self.updates_wiki_content_selector: str = data.get("updates_wiki_content_selector", ".mw-parser-output")
-        self.versions: list[GameVersion] = [
-            GameVersion(
-                id=v["id"],
-                name=v["name"],
-                description=v.get("description", ""),
-                icon=v.get("icon", ""),
+        self.icon: str = get("icon", "")
+        self.reddit: str = get("reddit", "")
+        self.updates_url: str = get("updates_url", "")
+        self.updates_is_rss: bool = get("updates_is_rss", False)
+        self.updates_use_js: bool = get("updates_use_js", False)
+        self.updates_selectors: dict[str, str] = get("updates_selectors", {})
+        self.updates_max_dropdown_options: int | None = get("updates_max_dropdown_options")
+        self.updates_limit: int = get("updates_limit", 10)
+        self.updates_forum_mode: bool = get("updates_forum_mode", False)
+        self.updates_forum_pagination_selector: str = get("updates_forum_pagination_selector", ".ipsPagination_next")
+        self.updates_forum_page_limit: int = get("updates_forum_page_limit", 1)
+        self.updates_fetch_thread_content: bool = get("updates_fetch_thread_content", False)
+        self.updates_thread_content_selector: str = get("updates_thread_content_selector", "")
+        self.updates_auto_detect_date: bool = get("updates_auto_detect_date", False)
+        self.updates_wiki_mode: bool = get("updates_wiki_mode", False)
+        self.updates_wiki_link_selector: str = get("updates_wiki_link_selector", "a[href*='/wiki/Updates/']")
+        self.updates_wiki_content_selector: str = get("updates_wiki_content_selector", ".mw-parser-output")
+        self.server_schema: list[dict[str, Any]] = get("server_schema", [])
+        # Versions and columns are built on first access (see properties below)
+        self._versions_raw: list[dict[str, Any]] = get("versions", [])
+        self._versions: tuple[GameVersion, ...] | None = None
+        self._columns_raw: list[dict[str, Any]] = get("table_columns", [])
+        self._columns: list[ColumnDefinition] | None = None
+
+    @property
+    def versions(self) -> tuple[GameVersion, ...]:
+        """Game versions, built from the YAML data on first access."""
+        if self._versions is None:
+            self._versions = tuple(
+                _shared_version(
+                    GameVersion(
+                        id=v["id"],
+                        name=v["name"],
+                        description=v.get("description", ""),
+                        icon=v.get("icon", ""),
+                    )
+                )
+                for v in self._versions_raw
             )
-            for v in data.get("versions", [])
-        ]
-        self.columns: list[ColumnDefinition] = [
-            ColumnDefinition(
-                id=col["id"],
-                label=col["label"],
-                width=col["width"],
-            )
-            for col in data.get("table_columns", [])
-        ]
-        self.server_schema: list[dict[str, Any]] = data.get("server_schema", [])
+        return self._versions
+
+    @property
+    def columns(self) -> list[ColumnDefinition]:
+        """Table column definitions, built from the YAML data on first access."""
+        if self._columns is None:
+            self._columns = [
+                ColumnDefinition(
+                    id=col["id"],
+                    label=col["label"],
+                    width=col["width"],
+                )
+                for col in self._columns_raw
+            ]
+        return self._columns
+
+    @property
+    def updates_config(self) -> UpdatesConfig:
+        """Updates fetch settings bundled for the fetch service."""
+        return UpdatesConfig(
+            url=self.updates_url,
+            is_rss=self.updates_is_rss,
+            use_js=self.updates_use_js,
+            selectors=self.updates_selectors,
+            limit=self.updates_limit,
+            max_dropdown_options=self.updates_max_dropdown_options,
+            forum_mode=self.updates_forum_mode,
+            forum_pagination_selector=self.updates_forum_pagination_selector,
+            forum_page_limit=self.updates_forum_page_limit,
+            fetch_thread_content=self.updates_fetch_thread_content,
+            thread_content_selector=self.updates_thread_content_selector,
+            auto_detect_date=self.updates_auto_detect_date,
+            wiki_mode=self.updates_wiki_mode,
+            wiki_update_link_selector=self.updates_wiki_link_selector,
+            wiki_content_selector=self.updates_wiki_content_selector,
+        )
 
     def to_game(self) -> Game:
         """Convert to Game model.
@@ -78,17 +235,51 @@ class GameDefinition:
         Returns:
             Game instance
         """
-        return Game(
-            id=self.id,
-            name=self.name,
-            icon=self.icon,
-            versions=self.versions,
-        )
+        return _make_game(self.id, self.name, self.icon, self.versions)
 
 
 class ServerDefinition:
     """Server definition loaded from YAML."""
 
+    __slots__ = (
+        "data",
+        "game_id",
+        "id",
+        "filename",
+        "name",
+        "host",
+        "patchlist",
+        "version_id",
+        "status",
+        "players",
+        "max_players",
+        "alliance_count",
+        "horde_count",
+        "uptime",
+        "description",
+        "icon",
+        "reddit",
+        "updates_url",
+        "updates_is_rss",
+        "updates_use_js",
+        "updates_selectors",
+        "updates_max_dropdown_options",
+        "updates_limit",
+        "updates_forum_mode",
+        "updates_forum_pagination_selector",
+        "updates_forum_page_limit",
+        "updates_fetch_thread_content",
+        "updates_thread_content_selector",
+        "updates_auto_detect_date",
+        "updates_wiki_mode",
+        "updates_wiki_link_selector",
+        "updates_wiki_content_selector",
+        "scraping",
+        "ping_ms",
+        "_host_parsed",
+        "_port_parsed",
+    )
+
     def __init__(self, data: dict[str, Any], game_id: str | None = None):
         """Initialize server definition.
 
@@ -96,66 +287,98 @@ class ServerDefinition:
             data: Server data from YAML
             game_id: Game ID (if not in data, will be inferred from directory)
         """
+        # Raw YAML data is kept (values are shared, not copied) so get_field can
+        # serve schema-specific keys and ServerEditor can write the file back
+        # without persisting runtime state such as scraped player counts
         self.data = data
+        get = data.get  # Bound once; this constructor runs for every server on each load
         # If game_id not in YAML, use the one passed from directory structure
-        self.game_id: str = data.get("game_id", game_id or "")
+        self.game_id: str = _intern(get("game_id", game_id or ""))
         # Server ID is scoped to game (e.g., "retro" becomes "wow.retro")
         self.id: str = f"{self.game_id}.{data['id']}"
+        # File stem under servers/{game_id}/, i.e. the ID without its game prefix
+        self.filename: str = self.id.split(".", 1)[1]
         self.name: str = data["name"]
-        self.host: str = data.get("host", "")
-        self.patchlist: str = data.get("patchlist", "")
-        self.version_id: str = data["version_id"]
-        self.status: ServerStatus = ServerStatus(data.get("status", "offline"))
-        self.players: int = data.get("players", -1)
-        self.max_players: int = data.get("max_players", 0)
+        host = get("host", "")
+        self.host: str = host
+        self.patchlist: str = get("patchlist", "")
+        self.version_id: str = _intern(data["version_id"])
+        self.status: ServerStatus = ServerStatus(get("status", "offline"))
+        self.players: int = get("players", -1)
+        self.max_players: int = get("max_players", 0)
         self.alliance_count: int | None = None  # Populated by player count scraping
         self.horde_count: int | None = None  # Populated by player count scraping
-        self.uptime: str = data.get("uptime", "-")
-        self.description: str = data.get("description", "")
-        self.icon: str = data.get("icon", "")
-        self.reddit: str = data.get("reddit", "")
-        self.updates_url: str = data.get("updates_url", "")
-        self.updates_is_rss: bool = data.get("updates_is_rss", False)
-        self.updates_use_js: bool = data.get("updates_use_js", False)
-        self.updates_selectors: dict[str, str] = data.get("updates_selectors", {})
-        self.updates_max_dropdown_options: int | None = data.get("updates_max_dropdown_options")
-        self.updates_limit: int = data.get("updates_limit", 10)
-        self.updates_forum_mode: bool = data.get("updates_forum_mode", False)
-        self.updates_forum_pagination_selector: str = data.get("updates_forum_pagination_selector", ".ipsPagination_next")
-        self.updates_forum_page_limit: int = data.get("updates_forum_page_limit", 1)
-        self.updates_fetch_thread_content: bool = data.get("updates_fetch_thread_content", False)
-        self.updates_thread_content_selector: str = data.get("updates_thread_content_selector", "")
-        self.updates_wiki_mode: bool = data.get("updates_wiki_mode", False)
-        self.updates_wiki_link_selector: str = data.get("updates_wiki_link_selector", "a[href*='/wiki/Updates/']")
-        self.updates_wiki_content_selector: str = data.get("updates_wiki_content_selector", ".mw-parser-output")
-        self.scraping: dict[str, Any] | None = data.get("scraping")  # Scraping configuration for player counts/uptime
+        self.uptime: str = get("uptime", "-")
+        self.description: str = get("description", "")
+        self.icon: str = get("icon", "")
+        self.reddit: str = get("reddit", "")
+        self.updates_url: str = get("updates_url", "")
+        self.updates_is_rss: bool = get("updates_is_rss", False)
+        self.updates_use_js: bool = get("updates_use_js", False)
+        self.updates_selectors: dict[str, str] = get("updates_selectors", {})
+        self.updates_max_dropdown_options: int | None = get("updates_max_dropdown_options")
+        self.updates_limit: int = get("updates_limit", 10)
+        self.updates_forum_mode: bool = get("updates_forum_mode", False)
+        self.updates_forum_pagination_selector: str = _intern(
+            get("updates_forum_pagination_selector", ".ipsPagination_next")
+        )
+        self.updates_forum_page_limit: int = get("updates_forum_page_limit", 1)
+        self.updates_fetch_thread_content: bool = get("updates_fetch_thread_content", False)
+        self.updates_thread_content_selector: str = get("updates_thread_content_selector", "")
+        self.updates_auto_detect_date: bool = get("updates_auto_detect_date", False)
+        self.updates_wiki_mode: bool = get("updates_wiki_mode", False)
+        self.updates_wiki_link_selector: str = get("updates_wiki_link_selector", "a[href*='/wiki/Updates/']")
+        self.updates_wiki_content_selector: str = get("updates_wiki_content_selector", ".mw-parser-output")
+        self.scraping: dict[str, Any] | None = get("scraping")  # Scraping configuration for player counts/uptime
         self.ping_ms: int = -1  # -1 means not pinged yet
 
+        # Parse host and port once (for backwards compatibility with "host:port")
+        hostname, sep, port = host.rpartition(":")
+        if sep:
+            self._host_parsed = hostname
+            try:
+                self._port_parsed = int(port)
+            except ValueError:
+                self._port_parsed = 0
+        else:
+            self._host_parsed = host
+            self._port_parsed = 0
+
+    @property
+    def updates_config(self) -> UpdatesConfig:
+        """Updates fetch settings bundled for the fetch service."""
+        return UpdatesConfig(
+            url=self.updates_url,
+            is_rss=self.updates_is_rss,
+            use_js=self.updates_use_js,
+            selectors=self.updates_selectors,
+            limit=self.updates_limit,
+            max_dropdown_options=self.updates_max_dropdown_options,
+            forum_mode=self.updates_forum_mode,
+            forum_pagination_selector=self.updates_forum_pagination_selector,
+            forum_page_limit=self.updates_forum_page_limit,
+            fetch_thread_content=self.updates_fetch_thread_content,
+            thread_content_selector=self.updates_thread_content_selector,
+            auto_detect_date=self.updates_auto_detect_date,
+            wiki_mode=self.updates_wiki_mode,
+            wiki_update_link_selector=self.updates_wiki_link_selector,
+            wiki_content_selector=self.updates_wiki_content_selector,
+        )
+
     def to_server(self) -> Server:
         """Convert to Server model.
 
         Returns:
             Server instance
         """
-        # Parse host and port if needed (for backwards compatibility)
-        host = self.host
-        port = 0
-        if ":" in self.host:
-            parts = self.host.rsplit(":", 1)
-            host = parts[0]
-            try:
-                port = int(parts[1])
-            except ValueError:
-                pass
-
         return Server(
             id=self.id,
             name=self.name,
             game_id=self.game_id,
             version_id=self.version_id,
             status=self.status,
-            host=host,
-            port=port,
+            host=self._host_parsed,
+            port=self._port_parsed,
             players=self.players,
             max_players=self.max_players,
             uptime=self.uptime,
@@ -178,16 +401,127 @@ class ServerDefinition:
 class ConfigLoader:
     """Loads game and server configurations from YAML files."""
 
-    def __init__(self, config_dir: Path, servers_dir: Path | None = None):
+    def __init__(
+        self,
+        config_dir: Path,
+        servers_dir: Path | None = None,
+        cache_dir: Path | None = None,
+    ):
         """Initialize config loader.
 
         Args:
             config_dir: Root configuration directory (for game definitions)
             servers_dir: Server configurations directory (defaults to config_dir/servers)
+            cache_dir: Directory for parsed JSON sidecars (None disables caching)
         """
         self.config_dir = config_dir
         self.games_dir = config_dir / "games"
         self.servers_dir = servers_dir if servers_dir else config_dir / "servers"
+        self.cache_dir = cache_dir
+        self._games_by_id: dict[str, GameDefinition] = {}
+        self._server_files: dict[str, Path] = {}
+        # Bounded LRU of parsed files keyed by content digest (see _load_yaml)
+        self._parsed_cache: OrderedDict[bytes, Any] = OrderedDict()
+        self._parsed_cache_lock = threading.Lock()
+
+    def _load_yaml(self, yaml_file: Path, cache_name: Path) -> Any:
+        """Load a YAML file, reusing an earlier parse of identical content.
+
+        Parsed data is kept in an LRU cache keyed by content hash, so unchanged
+        files are never re-parsed on reload. Each caller gets its own copy,
+        since definitions and ping results mutate the loaded dicts.
+
+        Args:
+            yaml_file: YAML file to load
+            cache_name: Sidecar path relative to the cache directory
+
+        Returns:
+            Parsed YAML data
+        """
+        raw = yaml_file.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        with self._parsed_cache_lock:
+            cached = self._parsed_cache.get(digest)
+            if cached is not None:
+                self._parsed_cache.move_to_end(digest)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        data = self._parse_yaml(yaml_file, raw, cache_name)
+        with self._parsed_cache_lock:
+            self._parsed_cache[digest] = data
+            if len(self._parsed_cache) > _PARSE_CACHE_SIZE:
+                self._parsed_cache.popitem(last=False)
+        return copy.deepcopy(data)
+
+    def _parse_yaml(self, yaml_file: Path, raw: bytes, cache_name: Path) -> Any:
+        """Parse YAML content, using a JSON sidecar when it is up to date.
+
+        Args:
+            yaml_file: YAML file the content was read from
+            raw: File content
+            cache_name: Sidecar path relative to the cache directory
+
+        Returns:
+            Parsed YAML data
+        """
+        if self.cache_dir is None:
+            return yaml.load(raw, Loader=_Loader)
+
+        cache_file = self.cache_dir / cache_name
+        # Key on exact mtime + size: shutil.copy2 can install a file with an older mtime
+        stat = yaml_file.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+        data = yaml.load(raw, Loader=_Loader)
+
+        # Write atomically so a concurrent reader never sees a partial sidecar
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            payload = json.dumps({"key": key, "data": data}, separators=(",", ":"))
+            # Skip data JSON can't represent faithfully (dates, non-string keys)
+            if json.loads(payload)["data"] == data:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(payload, encoding="utf-8")
+                os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            tmp_file.unlink(missing_ok=True)
+
+        return data
+
+    def _load_compiled_games(self) -> list[dict[str, Any]] | None:
+        """Load game data from the precompiled module if it is current.
+
+        Returns:
+            List of game data dicts, or None if YAML must be parsed instead
+        """
+        if self.games_dir != _BUNDLED_GAMES_DIR:
+            return None
+
+        try:
+            from pserver_manager import _compiled_configs
+        except ImportError:
+            return None
+
+        try:
+            compiled_mtime = Path(_compiled_configs.__file__).stat().st_mtime_ns
+            yaml_files = _scan_yaml_files(self.games_dir)
+            if {f.name for f in yaml_files} != _compiled_configs.GAMES.keys():
+                return None
+            if any(f.stat().st_mtime_ns > compiled_mtime for f in yaml_files):
+                return None
+        except OSError:
+            return None
+
+        # Copy so callers can't mutate the module-level literals
+        return copy.deepcopy(list(_compiled_configs.GAMES.values()))
 
     def load_games(self) -> list[GameDefinition]:
         """Load all game definitions.
@@ -195,16 +529,53 @@ class ConfigLoader:
         Returns:
             List of game definitions
         """
-        games = []
-        if not self.games_dir.exists():
-            return games
+        compiled = self._load_compiled_games()
+        if compiled is not None:
+            games = [GameDefinition(data) for data in compiled]
+        else:
+            games = [
+                GameDefinition(self._load_yaml(yaml_file, Path("games") / f"{yaml_file.name}.json"))
+                for yaml_file in _scan_yaml_files(self.games_dir)
+            ]
+
+        self._games_by_id = {game.id: game for game in games}
+        return sorted(games, key=lambda g: g.name)
 
-        for yaml_file in self.games_dir.glob("*.yaml"):
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                games.append(GameDefinition(data))
+    def discover_server_files(self) -> dict[str, list[Path]]:
+        """Find server definition files without parsing them.
 
-        return sorted(games, key=lambda g: g.name)
+        Returns:
+            Mapping of game ID (inferred from directory name) to YAML file paths
+        """
+        server_files: dict[str, list[Path]] = {}
+        try:
+            with os.scandir(self.servers_dir) as entries:
+                game_dirs = [entry.name for entry in entries if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return server_files
+
+        # Game-specific subdirectories (e.g., servers/wow/*.yaml)
+        for game_id in game_dirs:
+            server_files[game_id] = _scan_yaml_files(self.servers_dir / game_id)
+
+        return server_files
+
+    def load_servers_for_game(
+        self, game_id: str, yaml_files: list[Path] | None = None
+    ) -> list[ServerDefinition]:
+        """Load server definitions for a single game.
+
+        Args:
+            game_id: Game ID (name of the game's servers subdirectory)
+            yaml_files: Files to load (discovered from the game directory if None)
+
+        Returns:
+            List of server definitions
+        """
+        if yaml_files is None:
+            yaml_files = _scan_yaml_files(self.servers_dir / game_id)
+
+        return [self._load_server(game_id, yaml_file) for yaml_file in yaml_files]
 
     def load_servers(self) -> list[ServerDefinition]:
         """Load all server definitions.
@@ -212,31 +583,164 @@ class ConfigLoader:
         Returns:
             List of server definitions
         """
-        servers = []
-        if not self.servers_dir.exists():
-            return servers
+        pairs = [
+            (game_id, yaml_file)
+            for game_id, yaml_files in self.discover_server_files().items()
+            for yaml_file in yaml_files
+        ]
+        snapshot_key = self._servers_snapshot_key(pairs)
+        snapshot = self._read_servers_snapshot(snapshot_key)
+        if snapshot is not None and len(snapshot) == len(pairs):
+            # Nothing changed since the snapshot: one JSON read replaces every file
+            servers = [
+                ServerDefinition(data, game_id=game_id)
+                for (game_id, _), data in zip(pairs, snapshot)
+            ]
+        elif len(pairs) < _PARALLEL_LOAD_THRESHOLD:
+            servers = [self._load_server(game_id, yaml_file) for game_id, yaml_file in pairs]
+            self._write_servers_snapshot(snapshot_key, [server.data for server in servers])
+        else:
+            # File reads release the GIL, so overlapping them helps on slow disks
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(pairs))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                servers = list(executor.map(lambda pair: self._load_server(*pair), pairs))
+            self._write_servers_snapshot(snapshot_key, [server.data for server in servers])
+
+        self._server_files = {
+            server.id: yaml_file for server, (_, yaml_file) in zip(servers, pairs)
+        }
+        return servers
 
-        # Load from game-specific subdirectories (e.g., servers/wow/*.yaml)
-        for game_dir in self.servers_dir.iterdir():
-            if game_dir.is_dir():
-                game_id = game_dir.name  # Infer game_id from directory name
-                for yaml_file in game_dir.glob("*.yaml"):
-                    with open(yaml_file, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                        servers.append(ServerDefinition(data, game_id=game_id))
+    def _servers_snapshot_key(self, pairs: list[tuple[str, Path]]) -> str | None:
+        """Compute the key of the all-servers snapshot for a set of files.
 
-        return servers
+        Args:
+            pairs: (game_id, yaml_file) pairs in load order
+
+        Returns:
+            Digest over every file's path, mtime and size, or None if caching is off
+        """
+        if self.cache_dir is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            for _, yaml_file in pairs:
+                stat = yaml_file.stat()
+                digest.update(f"{yaml_file}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _read_servers_snapshot(self, key: str | None) -> list[Any] | None:
+        """Read the all-servers snapshot if it was written for the same files.
+
+        Args:
+            key: Current snapshot key
+
+        Returns:
+            Parsed server data in load order, or None on a miss
+        """
+        if key is None:
+            return None
+        try:
+            with open(self.cache_dir / _SERVERS_SNAPSHOT, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        return None
+
+    def _write_servers_snapshot(self, key: str | None, data: list[Any]) -> None:
+        """Write the all-servers snapshot atomically.
+
+        Args:
+            key: Snapshot key the data belongs to
+            data: Parsed server data in load order
+        """
+        if key is None:
+            return
+
+        snapshot_file = self.cache_dir / _SERVERS_SNAPSHOT
+        tmp_file = snapshot_file.with_name(snapshot_file.name + ".tmp")
+        try:
+            payload = json.dumps({"key": key, "data": data}, separators=(",", ":"))
+            # Skip data JSON can't represent faithfully (dates, non-string keys)
+            if json.loads(payload)["data"] == data:
+                snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(payload, encoding="utf-8")
+                os.replace(tmp_file, snapshot_file)
+        except (OSError, TypeError, ValueError):
+            tmp_file.unlink(missing_ok=True)
+
+    def _load_server(self, game_id: str, yaml_file: Path) -> ServerDefinition:
+        """Load a single server definition file.
+
+        Args:
+            game_id: Game ID the server belongs to
+            yaml_file: Server YAML file
+
+        Returns:
+            Server definition
+        """
+        data = self._load_yaml(yaml_file, Path("servers") / game_id / f"{yaml_file.name}.json")
+        return ServerDefinition(data, game_id=game_id)
+
+    def load_server_file(self, game_id: str, yaml_file: Path) -> ServerDefinition:
+        """Load a single server definition file, e.g. after it was edited.
+
+        Args:
+            game_id: Game ID the server belongs to
+            yaml_file: Server YAML file
 
-    def get_game_by_id(self, game_id: str, games: list[GameDefinition]) -> GameDefinition | None:
+        Returns:
+            Server definition
+        """
+        server = self._load_server(game_id, yaml_file)
+        self._server_files[server.id] = yaml_file
+        return server
+
+    def get_server_file(self, server_id: str) -> Path | None:
+        """Get the YAML file a server was loaded from.
+
+        Args:
+            server_id: Server ID
+
+        Returns:
+            Path of the server's YAML file or None if it was not loaded
+        """
+        return self._server_files.get(server_id)
+
+    def forget_server_file(self, game_id: str, yaml_file: Path) -> None:
+        """Forget a server file that has been deleted and remove its JSON sidecar.
+
+        Args:
+            game_id: Game ID the server belonged to
+            yaml_file: Removed server YAML file
+        """
+        for server_id, server_file in list(self._server_files.items()):
+            if server_file == yaml_file:
+                del self._server_files[server_id]
+        if self.cache_dir is not None:
+            sidecar = self.cache_dir / "servers" / game_id / f"{yaml_file.name}.json"
+            sidecar.unlink(missing_ok=True)
+
+    def get_game_by_id(
+        self, game_id: str, games: list[GameDefinition] | None = None
+    ) -> GameDefinition | None:
         """Get game definition by ID.
 
         Args:
             game_id: Game ID to find
-            games: List of game definitions
+            games: List of game definitions to search (defaults to the last loaded games)
 
         Returns:
             Game definition or None if not found
         """
+        if games is None:
+            return self._games_by_id.get(game_id)
+
         for game in games:
             if game.id == game_id:
                 return game
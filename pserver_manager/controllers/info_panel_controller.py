@@ -5,9 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QLabel
 
 if TYPE_CHECKING:
     from pserver_manager.config_loader import GameDefinition, ServerDefinition
+    from pserver_manager.models import UpdatesConfig
     from pserver_manager.services.cache_service import CacheService, ServerDataCache
     from pserver_manager.services.data_fetch_service import DataFetchService
     from pserver_manager.widgets.info_panel import InfoPanel
@@ -57,36 +59,16 @@ class InfoPanelController(QObject):
         # Clear server info since we're viewing game-level data
         self._info_panel.set_server_info(None)
 
-        has_reddit = bool(game.reddit)
-        has_updates = bool(game.updates_url)
+        reddit = game.reddit or ""
+        updates_url = game.updates_url or ""
 
-        if has_reddit:
-            self._info_panel.set_subreddit(game.reddit)
-            self._data_fetch_service.fetch_reddit_posts(game.reddit, limit=15, sort="hot")
-        else:
-            self._info_panel.set_subreddit("")
+        self._info_panel.set_subreddit(reddit)
+        if reddit:
+            self._data_fetch_service.fetch_reddit_posts(reddit, limit=15, sort="hot")
 
-        if has_updates:
-            self._info_panel.set_updates_url(game.updates_url)
-            self._fetch_updates_with_cache(
-                url=game.updates_url,
-                is_rss=game.updates_is_rss,
-                use_js=game.updates_use_js,
-                selectors=game.updates_selectors,
-                limit=10,
-                max_dropdown_options=game.updates_max_dropdown_options,
-                forum_mode=game.updates_forum_mode,
-                forum_pagination_selector=game.updates_forum_pagination_selector,
-                forum_page_limit=game.updates_forum_page_limit,
-                fetch_thread_content=game.updates_fetch_thread_content,
-                thread_content_selector=game.updates_thread_content_selector,
-                auto_detect_date=game.data.get('updates_auto_detect_date', False),
-                wiki_mode=game.updates_wiki_mode,
-                wiki_update_link_selector=game.updates_wiki_link_selector,
-                wiki_content_selector=game.updates_wiki_content_selector,
-            )
-        else:
-            self._info_panel.set_updates_url("")
+        self._info_panel.set_updates_url(updates_url)
+        if updates_url:
+            self._fetch_updates_with_cache(game.updates_config)
 
         # Always keep panel visible - Info tab is persistent and available for server selection
         # Even if the game has no Reddit/Updates, the Info tab will show server data when selected
@@ -120,9 +102,8 @@ class InfoPanelController(QObject):
 
         if has_updates:
             self._info_panel.set_updates_url(server.updates_url)
-            if cached_data and cached_data.updates is not None:
-                updates_dict = [update.to_dict() for update in cached_data.updates]
-                self._info_panel.set_updates(updates_dict)
+            if cached_data and cached_data.updates_dicts is not None:
+                self._info_panel.set_updates(cached_data.updates_dicts)
             elif cached_data and cached_data.updates_error:
                 self._info_panel.set_content(f"Error loading updates:\n{cached_data.updates_error}")
             else:
@@ -156,24 +137,7 @@ class InfoPanelController(QObject):
             self._notifications.warning("No Updates", "Selected server has no updates configured")
             return
 
-        self._fetch_updates_with_cache(
-            url=server.updates_url,
-            is_rss=server.updates_is_rss,
-            use_js=server.updates_use_js,
-            selectors=server.updates_selectors,
-            limit=getattr(server, 'updates_limit', 10),
-            max_dropdown_options=server.updates_max_dropdown_options,
-            forum_mode=server.updates_forum_mode,
-            forum_pagination_selector=server.updates_forum_pagination_selector,
-            forum_page_limit=server.updates_forum_page_limit,
-            fetch_thread_content=server.updates_fetch_thread_content,
-            thread_content_selector=server.updates_thread_content_selector,
-            auto_detect_date=server.data.get('updates_auto_detect_date', False),
-            wiki_mode=server.updates_wiki_mode,
-            wiki_update_link_selector=server.updates_wiki_link_selector,
-            wiki_content_selector=server.updates_wiki_content_selector,
-            force=True,
-        )
+        self._fetch_updates_with_cache(server.updates_config, force=True)
         self._notifications.info("Refreshing", f"Fetching updates for {server.name}...")
 
     def force_refresh_updates(self, game: GameDefinition) -> None:
@@ -186,90 +150,25 @@ class InfoPanelController(QObject):
             self._notifications.warning("No Updates", "No updates source available for current selection")
             return
 
-        self._fetch_updates_with_cache(
-            url=game.updates_url,
-            is_rss=game.updates_is_rss,
-            use_js=game.updates_use_js,
-            selectors=game.updates_selectors,
-            limit=10,
-            max_dropdown_options=game.updates_max_dropdown_options,
-            forum_mode=game.updates_forum_mode,
-            forum_pagination_selector=game.updates_forum_pagination_selector,
-            forum_page_limit=game.updates_forum_page_limit,
-            fetch_thread_content=game.updates_fetch_thread_content,
-            thread_content_selector=game.updates_thread_content_selector,
-            auto_detect_date=getattr(game, 'updates_auto_detect_date', False),
-            wiki_mode=game.updates_wiki_mode,
-            wiki_update_link_selector=game.updates_wiki_link_selector,
-            wiki_content_selector=game.updates_wiki_content_selector,
-            force=True,
-        )
+        self._fetch_updates_with_cache(game.updates_config, force=True)
         self._notifications.info("Refreshing", "Fetching latest updates...")
 
-    def _fetch_updates_with_cache(
-        self,
-        url: str,
-        is_rss: bool,
-        use_js: bool,
-        selectors: dict,
-        limit: int = 10,
-        max_dropdown_options: int | None = None,
-        forum_mode: bool = False,
-        forum_pagination_selector: str = ".ipsPagination_next",
-        forum_page_limit: int = 1,
-        fetch_thread_content: bool = False,
-        thread_content_selector: str = "",
-        auto_detect_date: bool = False,
-        wiki_mode: bool = False,
-        wiki_update_link_selector: str = "a[href*='/wiki/Updates/']",
-        wiki_content_selector: str = ".mw-parser-output",
-        force: bool = False,
-    ) -> None:
+    def _fetch_updates_with_cache(self, config: UpdatesConfig, force: bool = False) -> None:
         """Fetch updates with cache checking.
 
         Args:
-            url: Updates URL
-            is_rss: Whether URL is RSS feed
-            use_js: Whether to use JavaScript rendering
-            selectors: CSS selectors dict
-            limit: Number of updates to fetch
-            max_dropdown_options: Max dropdown options
-            forum_mode: Whether to scrape forum threads
-            forum_pagination_selector: CSS selector for next page link
-            forum_page_limit: Maximum number of forum pages
-            fetch_thread_content: Whether to fetch full content from thread pages
-            thread_content_selector: CSS selector for content within thread page
-            auto_detect_date: If True, scan update content for dates if time selector fails
-            wiki_mode: Whether to scrape MediaWiki-based updates
-            wiki_update_link_selector: CSS selector for update page links in wiki mode
-            wiki_content_selector: CSS selector for content within wiki update pages
+            config: Updates fetch settings
             force: If True, bypass cache
         """
         # Check cache unless force refresh
-        if not force and not self._cache_service.should_fetch_updates(url):
-            cached_updates = self._cache_service.get_cached_updates(url)
+        if not force and not self._cache_service.should_fetch_updates(config.url):
+            cached_updates = self._cache_service.get_cached_updates(config.url)
             if cached_updates:
                 self._info_panel.set_updates(cached_updates)
                 return
 
         # Fetch updates
-        self._data_fetch_service.fetch_updates(
-            url=url,
-            is_rss=is_rss,
-            use_js=use_js,
-            selectors=selectors,
-            limit=limit,
-            max_dropdown_options=max_dropdown_options,
-            forum_mode=forum_mode,
-            forum_pagination_selector=forum_pagination_selector,
-            forum_page_limit=forum_page_limit,
-            fetch_thread_content=fetch_thread_content,
-            thread_content_selector=thread_content_selector,
-            auto_detect_date=auto_detect_date,
-            wiki_mode=wiki_mode,
-            wiki_update_link_selector=wiki_update_link_selector,
-            wiki_content_selector=wiki_content_selector,
-        )
+        self._data_fetch_service.fetch_updates(config)
 
     def _on_reddit_fetched(self, posts: list) -> None:
         """Handle Reddit posts being fetched.
@@ -305,8 +204,6 @@ class InfoPanelController(QObject):
         Args:
             error: Error message
         """
-        from PySide6.QtWidgets import QLabel
-
         self._info_panel._clear_updates_cards()
         label = QLabel(f"Error loading updates:\n{error}")
         label.setWordWrap(True)
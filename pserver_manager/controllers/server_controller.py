@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import webbrowser
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
@@ -52,11 +53,29 @@ class ServerController(QObject):
 
     def reload_servers(self) -> None:
         """Reload all servers and emit signal."""
-        self._server_service.reload()
-        game_defs = self._server_service.get_games()
-        server_defs = self._server_service.get_servers()
+        game_defs, server_defs = self._server_service.reload()
         self.servers_loaded.emit(game_defs, server_defs)
 
+    def reload_server(self, server_id: str) -> ServerDefinition | None:
+        """Re-read a single edited server without reloading everything.
+
+        Emits servers_loaded so the sidebar picks up a changed version; it
+        is only rebuilt when the set of used versions actually changed.
+
+        Args:
+            server_id: Server ID
+
+        Returns:
+            Updated server definition or None
+        """
+        server = self._server_service.reload_server(server_id)
+        if server and self._current_server and self._current_server.id == server_id:
+            self._current_server = server
+        self.servers_loaded.emit(
+            self._server_service.get_games(), self._server_service.get_servers()
+        )
+        return server
+
     def get_game_by_id(self, game_id: str) -> GameDefinition | None:
         """Get game definition by ID.
 
@@ -95,8 +114,13 @@ class ServerController(QObject):
 
         if self._server_service.delete_server(server_id):
             self._cache_service.clear_server_cache(server_id)
+            if self._current_server and self._current_server.id == server_id:
+                self._current_server = None
             self._notifications.success("Server Deleted", f"'{server.name}' deleted successfully")
             self.server_deleted.emit(server_id)
+            self.servers_loaded.emit(
+                self._server_service.get_games(), self._server_service.get_servers()
+            )
             return True
         else:
             self._notifications.error("Delete Failed", "Server configuration file not found")
@@ -174,8 +198,6 @@ class ServerController(QObject):
         Returns:
             True if URL was opened, False otherwise
         """
-        import webbrowser
-
         server = self.get_server_by_id(server_id)
         if not server:
             return False
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
 
 if TYPE_CHECKING:
     from qtframework import Application
@@ -38,17 +39,50 @@ class ThemeController(QObject):
         self._notifications = notifications
         self._theme_manager = application.theme_manager
 
+        # Theme list/info only change on reload_themes()
+        self._themes_cache: list[str] | None = None
+        self._info_cache: dict[str, dict | None] = {}
+        # Digest of the stylesheet last applied by reload_themes()
+        self._stylesheet_hash: bytes | None = None
+
+        # Coalesce rapid theme switches into a single settings write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_config)
+        application.aboutToQuit.connect(self._flush_pending_config)
+
     def apply_theme(self, theme_name: str) -> None:
-        """Apply a theme and save to config.
+        """Apply a theme and schedule saving it to config.
 
         Args:
             theme_name: Theme name to apply
         """
-        self._theme_manager.set_theme(theme_name)
-        self._config_manager.set("ui.theme", theme_name)
+        current_theme = self._theme_manager.get_current_theme()
+        if current_theme is None or current_theme.name != theme_name:
+            self._theme_manager.set_theme(theme_name)
+
+        # Re-selecting the saved theme leaves nothing to write
+        if self._config_manager.get("ui.theme") != theme_name:
+            self._config_manager.set("ui.theme", theme_name)
+            self._save_timer.start()
+
+    def save_config(self) -> None:
+        """Write the settings file now, absorbing any pending debounced save."""
+        self._save_timer.stop()
+        self._flush_config()
+
+    def _flush_config(self) -> None:
+        """Write the settings file."""
         config_file = self._app_paths.get_settings_file()
         self._config_manager.save(config_file)
 
+    def _flush_pending_config(self) -> None:
+        """Write the settings file now if a debounced save is pending."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_config()
+
     def get_current_theme_name(self) -> str | None:
         """Get the current theme name.
 
@@ -64,7 +98,9 @@ class ThemeController(QObject):
         Returns:
             List of theme names
         """
-        return self._theme_manager.list_themes()
+        if self._themes_cache is None:
+            self._themes_cache = self._theme_manager.list_themes()
+        return self._themes_cache
 
     def get_theme_info(self, theme_name: str) -> dict | None:
         """Get theme information.
@@ -75,7 +111,9 @@ class ThemeController(QObject):
         Returns:
             Theme info dict or None
         """
-        return self._theme_manager.get_theme_info(theme_name)
+        if theme_name not in self._info_cache:
+            self._info_cache[theme_name] = self._theme_manager.get_theme_info(theme_name)
+        return self._info_cache[theme_name]
 
     def reload_themes(self) -> None:
         """Reload all themes from disk."""
@@ -91,14 +129,20 @@ class ThemeController(QObject):
                 return
 
             # Reload themes in theme manager
+            self._themes_cache = None
+            self._info_cache.clear()
             self._theme_manager.reload_themes()
 
             # Reapply current theme
             self._theme_manager.set_theme(current_theme)
 
-            # Regenerate and apply stylesheet
+            # Regenerate the stylesheet, but only hand it to Qt when it changed:
+            # setStyleSheet re-polishes and relayouts every widget
             stylesheet = self._theme_manager.get_stylesheet()
-            app.setStyleSheet(stylesheet)
+            stylesheet_hash = hashlib.blake2b(stylesheet.encode(), digest_size=16).digest()
+            if stylesheet_hash != self._stylesheet_hash:
+                app.setStyleSheet(stylesheet)
+                self._stylesheet_hash = stylesheet_hash
 
         except Exception as e:
             self._notifications.error("Theme Reload Failed", f"Error: {str(e)}")
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import importlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QActionGroup
-from PySide6.QtWidgets import QSplitter
+from PySide6.QtWidgets import QApplication, QSplitter
 
 from qtframework import Application
 from qtframework.config import ConfigManager
@@ -22,11 +29,10 @@ from qtframework.widgets.advanced.notifications import NotificationPosition
 from pserver_manager.config_loader import ColumnDefinition, ConfigLoader
 from pserver_manager.models import Game
 from pserver_manager.utils import get_app_paths
-from pserver_manager.utils.schema_migrations import migrate_user_servers
+from pserver_manager.utils.paths import has_yaml_files, yaml_tree_digest
+from pserver_manager.utils.qt_background_worker import BackgroundHelper
+from pserver_manager.utils.schema_migrations import ServerSchemaMigrator, migrate_user_servers
 from pserver_manager.widgets import GameSidebar, InfoPanel, ServerTable
-from pserver_manager.widgets.server_editor import ServerEditor
-from pserver_manager.widgets.preferences_dialog import PreferencesDialog
-from pserver_manager.widgets.update_dialog import UpdateDialog
 
 # Import services and controllers
 from pserver_manager.services import (
@@ -42,6 +48,34 @@ from pserver_manager.controllers import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Package resource directories, resolved relative to this file so the app
+# works regardless of the current working directory
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_CONFIG_DIR = _PACKAGE_DIR / "config"
+_THEMES_DIR = _PACKAGE_DIR / "themes"
+_ICONS_DIR = _PACKAGE_DIR / "icons"
+_TRANSLATIONS_DIR = _PACKAGE_DIR / "translations"
+_PLUGINS_DIR = _PACKAGE_DIR / "plugins"
+
+# Delay before a requested reload runs, so repeated requests share one
+_RELOAD_DEBOUNCE_MS = 50
+
+# Modules that are first imported mid-session (e.g. by the startup batch scan)
+_DEFERRED_MODULES = ("playwright.async_api",)
+
+# Generic columns for the "All Servers" view, built once and shared like game columns
+_ALL_SERVERS_COLUMNS: tuple[ColumnDefinition, ...] = (
+    ColumnDefinition("name", "Server Name", "stretch"),
+    ColumnDefinition("status", "Status", "content"),
+    ColumnDefinition("address", "Address", "content"),
+    ColumnDefinition("players", "Players", "content"),
+    ColumnDefinition("uptime", "Uptime", "content"),
+    ColumnDefinition("version", "Version", "content"),
+)
+
+
 class MainWindow(BaseWindow):
     """Main application window."""
 
@@ -64,8 +98,9 @@ class MainWindow(BaseWindow):
 
         # Initialize config loader
         self._config_loader = ConfigLoader(
-            config_dir=Path(__file__).parent / "config",
+            config_dir=_CONFIG_DIR,
             servers_dir=self._app_paths.get_servers_dir(),
+            cache_dir=self._app_paths.get_cache_dir() / "config",
         )
 
         # Initialize services
@@ -74,9 +109,6 @@ class MainWindow(BaseWindow):
         self._data_fetch_service = DataFetchService()
         self._update_service = UpdateService(self._app_paths)
 
-        # Load initial data through service
-        self._server_service.load_all()
-
         super().__init__(application=application)
         self.setWindowTitle("PServer Manager")
         self.setMinimumSize(1280, 800)
@@ -95,6 +127,7 @@ class MainWindow(BaseWindow):
         self._theme_controller = ThemeController(
             self.application, self._config_manager, self._app_paths, self._notifications
         )
+        self._create_theme_menu(self._theme_menu)
 
         # Connect controller signals
         self._connect_controller_signals()
@@ -105,40 +138,144 @@ class MainWindow(BaseWindow):
         self._data_fetch_service.batch_scan_finished.connect(self._on_batch_scan_finished)
         self._data_fetch_service.scan_error.connect(self._on_scan_error)
 
-        # Check for updates on startup (after window is shown)
+        # Startup update check runs in the background and reports back here
+        self._update_check_helper = BackgroundHelper()
+        self._update_check_helper.finished.connect(self._on_startup_update_check_finished)
+        self._update_check_helper.error.connect(self._on_startup_update_check_error)
+
+        # Coalesces bursts of refresh requests into one reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_RELOAD_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self._do_reload)
+        # Set when a refresh arrives during the startup load; replayed once it ends
+        self._reload_pending = False
+
+        # Load games and servers off the GUI thread; the window paints empty
+        # first and is filled in _on_initial_data_loaded
+        self._initial_load_helper = BackgroundHelper()
+        self._initial_load_helper.finished.connect(self._on_initial_data_loaded)
+        self._initial_load_helper.error.connect(self._on_initial_data_error)
+        self._initial_load_helper.run_task(self._server_service.load_all)
+
+    def _on_initial_data_loaded(self, _result: object) -> None:
+        """Fill the views once the startup load finishes, then start background work."""
+        self._populate_views()
+        self._replay_pending_reload()
+
+        # Both work on the loaded servers, so they are scheduled from here
+        QTimer.singleShot(1000, self._post_startup)
+
+    def _post_startup(self) -> None:
+        """Run the deferred startup work: update check, then batch scan."""
+        self._check_for_updates_on_startup()
+        self._start_batch_scan_if_enabled()
+
+    def _on_initial_data_error(self, error: str) -> None:
+        """Report a failed startup load and leave the views empty."""
+        logger.error("Failed to load configuration: %s", error)
+        self._notifications.error("Load Failed", f"Could not load server configuration: {error}")
+        self._replay_pending_reload()
         QTimer.singleShot(1000, self._check_for_updates_on_startup)
-        QTimer.singleShot(2000, self._start_batch_scan_if_enabled)
+
+    def _replay_pending_reload(self) -> None:
+        """Run a refresh that was requested while the startup load was running."""
+        if self._reload_pending:
+            self._reload_pending = False
+            self._reload_timer.start()
+
+    def _populate_views(self) -> None:
+        """Populate the sidebar and server table with the loaded data."""
+        self._update_sidebar(self._server_service.get_games(), self._server_service.get_servers())
+        self._show_all_servers()
+
+    def _update_sidebar(self, game_defs, server_defs) -> None:
+        """Rebuild the sidebar tree, unless it would come out the same.
+
+        The tree only depends on the games and on which versions have servers,
+        so edits, deletes and reloads that keep both leave it untouched.
+        """
+        # to_game() is memoized by config_loader._make_game, so this reuses models
+        games = tuple(gd.to_game() for gd in game_defs)
+        used_versions = frozenset((server.game_id, server.version_id) for server in server_defs)
+        sidebar_state = (games, used_versions)
+        if sidebar_state == self._sidebar_state:
+            return
+
+        self._sidebar_state = sidebar_state
+        self._sidebar.set_games(list(games), server_defs)
 
     def _perform_initial_migrations(self) -> None:
-        """Perform initial configuration and schema migrations."""
+        """Perform initial configuration and schema migrations.
+
+        Skipped entirely when the user servers tree and the schema version
+        are unchanged since the last run that finished its migrations.
+        """
+        state_file = self._app_paths.get_cache_dir() / "startup_state.json"
+        user_servers_dir = self._app_paths.get_servers_dir()
+        try:
+            saved_state = json.loads(state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            saved_state = None
+        if saved_state == self._startup_state(user_servers_dir):
+            return
+
         migration_marker = self._app_paths.get_user_data_dir() / ".migration_complete"
-        old_config_dir = Path(__file__).parent / "config"
+        marker_exists = migration_marker.exists()
+        old_config_dir = _CONFIG_DIR
         old_servers_dir = old_config_dir / "servers"
-        new_servers_dir = self._app_paths.get_servers_dir()
+
+        # Each probe walks a directory tree, so take each answer once
+        user_has_servers = has_yaml_files(user_servers_dir)
 
         # Check if old servers exist, new directory is empty, and migration hasn't run before
         needs_migration = (
-            not migration_marker.exists()
-            and old_servers_dir.exists()
-            and any(old_servers_dir.rglob("*.yaml"))
-            and not any(new_servers_dir.rglob("*.yaml"))
+            not marker_exists
+            and not user_has_servers
+            and has_yaml_files(old_servers_dir)
         )
 
         if needs_migration:
-            print("Migrating old configuration to new location...")
-            if self._app_paths.migrate_old_config(old_config_dir):
-                print(f"Configuration migrated to: {self._app_paths.get_user_data_dir()}")
-                migration_marker.write_text("Migration completed")
-        elif not migration_marker.exists() and not any(new_servers_dir.rglob("*.yaml")):
+            logger.info("Migrating old configuration to new location...")
+            if not self._app_paths.migrate_old_config(old_config_dir):
+                logger.error("Failed to migrate configuration from: %s", old_config_dir)
+                # Try again next launch
+                return
+            logger.info("Configuration migrated to: %s", self._app_paths.get_user_data_dir())
+            migration_marker.write_text("Migration completed")
+            # The migration just copied servers in
+            user_has_servers = has_yaml_files(user_servers_dir)
+        elif not marker_exists and not user_has_servers:
             migration_marker.write_text("No migration needed")
 
         # Migrate user servers to current schema if needed
-        user_servers_dir = self._app_paths.get_servers_dir()
-        if user_servers_dir.exists() and any(user_servers_dir.rglob("*.yaml")):
-            print("Checking server configurations for schema updates...")
+        if user_has_servers:
+            logger.info("Checking server configurations for schema updates...")
             migration_report = migrate_user_servers(user_servers_dir, show_report=False)
             if migration_report["migrated"] > 0:
-                print(f"Migrated {migration_report['migrated']} server(s) to current schema")
+                logger.info("Migrated %d server(s) to current schema", migration_report["migrated"])
+            if migration_report["failed"] > 0:
+                # Try again next launch
+                return
+
+        # Migrations may have rewritten files, so take the state afterwards
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            state_file.write_text(json.dumps(self._startup_state(user_servers_dir)), encoding="utf-8")
+        except OSError as e:
+            logger.debug("Could not save startup state: %s", e)
+
+    @staticmethod
+    def _startup_state(user_servers_dir: Path) -> list:
+        """Get the state that decides whether startup migrations must run.
+
+        Args:
+            user_servers_dir: User servers directory
+
+        Returns:
+            JSON-compatible [servers tree digest, schema version]
+        """
+        return [yaml_tree_digest(user_servers_dir), ServerSchemaMigrator.CURRENT_SCHEMA_VERSION]
 
     def _init_config(self) -> None:
         """Initialize configuration with defaults."""
@@ -148,7 +285,7 @@ class MainWindow(BaseWindow):
             try:
                 self._config_manager.load_file(config_file)
             except Exception as e:
-                print(f"Warning: Could not load config file: {e}")
+                logger.warning("Could not load config file: %s", e)
                 self._load_default_config()
         else:
             self._load_default_config()
@@ -201,8 +338,7 @@ class MainWindow(BaseWindow):
 
         # Create sidebar
         self._sidebar = GameSidebar()
-        games = [gd.to_game() for gd in self._server_service.get_games()]
-        self._sidebar.set_games(games, self._server_service.get_servers())
+        self._sidebar_state: tuple | None = None  # What the sidebar tree was built from
         self._sidebar.all_servers_selected.connect(self._on_all_servers_selected)
         self._sidebar.game_selected.connect(self._on_game_selected)
         self._sidebar.version_selected.connect(self._on_version_selected)
@@ -211,7 +347,6 @@ class MainWindow(BaseWindow):
 
         # Create server table
         self._server_table = ServerTable()
-        self._show_all_servers()
         self._server_table.server_selected.connect(self._on_server_selected)
         self._server_table.server_double_clicked.connect(self._on_server_double_clicked)
         self._server_table.edit_server_requested.connect(self._on_edit_server)
@@ -219,6 +354,8 @@ class MainWindow(BaseWindow):
         self._server_table.manage_accounts_requested.connect(self._on_manage_accounts)
         self._server_table.register_requested.connect(self._on_register)
         self._server_table.login_requested.connect(self._on_login)
+        self._server_table.ping_finished.connect(self._on_ping_finished)
+        self._server_table.player_counts_finished.connect(self._on_player_counts_finished)
 
         # Create Info panel
         self._info_panel = InfoPanel()
@@ -279,95 +416,75 @@ class MainWindow(BaseWindow):
 
         parent_layout.add_widget(status_bar)
 
+    # Menu layout: (menu title, entries). An entry is (label, shortcut, handler
+    # name), None for a separator, or _THEME_SUBMENU for the theme picker.
+    _THEME_SUBMENU = "theme"
+    _MENUS = (
+        ("&File", (
+            ("&Add Server", "Ctrl+N", "_on_add_server"),
+            ("&Refresh", "F5", "_on_refresh"),
+            ("&Ping Servers", "Ctrl+P", "_on_ping_servers"),
+            ("Fetch Server &Info", "Ctrl+L", "_on_fetch_player_counts"),
+            ("Refresh &Reddit", "Ctrl+R", "_on_refresh_reddit"),
+            ("Refresh &Updates", "Ctrl+U", "_on_refresh_updates"),
+            None,
+            ("E&xit", "Ctrl+Q", "close"),
+        )),
+        ("&View", (
+            ("Show &All Servers", "Ctrl+A", "_on_show_all"),
+            None,
+            _THEME_SUBMENU,
+        )),
+        ("&Settings", (
+            ("&Preferences", "Ctrl+,", "_on_settings"),
+        )),
+        ("&Help", (
+            ("&About", None, "_on_about"),
+        )),
+    )
+
     def _create_menu_bar(self):
-        """Create the menu bar."""
+        """Create the menu bar from the declarative _MENUS table."""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        add_server_action = QAction("&Add Server", self)
-        add_server_action.setShortcut("Ctrl+N")
-        add_server_action.triggered.connect(self._on_add_server)
-        file_menu.addAction(add_server_action)
-
-        refresh_action = QAction("&Refresh", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self._on_refresh)
-        file_menu.addAction(refresh_action)
-
-        ping_action = QAction("&Ping Servers", self)
-        ping_action.setShortcut("Ctrl+P")
-        ping_action.triggered.connect(self._on_ping_servers)
-        file_menu.addAction(ping_action)
-
-        fetch_info_action = QAction("Fetch Server &Info", self)
-        fetch_info_action.setShortcut("Ctrl+L")
-        fetch_info_action.triggered.connect(self._on_fetch_player_counts)
-        file_menu.addAction(fetch_info_action)
-
-        refresh_reddit_action = QAction("Refresh &Reddit", self)
-        refresh_reddit_action.setShortcut("Ctrl+R")
-        refresh_reddit_action.triggered.connect(self._on_refresh_reddit)
-        file_menu.addAction(refresh_reddit_action)
-
-        refresh_updates_action = QAction("Refresh &Updates", self)
-        refresh_updates_action.setShortcut("Ctrl+U")
-        refresh_updates_action.triggered.connect(self._on_refresh_updates)
-        file_menu.addAction(refresh_updates_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # View menu
-        view_menu = menubar.addMenu("&View")
-        show_all_action = QAction("Show &All Servers", self)
-        show_all_action.setShortcut("Ctrl+A")
-        show_all_action.triggered.connect(self._on_show_all)
-        view_menu.addAction(show_all_action)
-
-        view_menu.addSeparator()
-
-        theme_menu = view_menu.addMenu("&Theme")
-        self._create_theme_menu(theme_menu)
-
-        # Settings menu
-        settings_menu = menubar.addMenu("&Settings")
-        preferences_action = QAction("&Preferences", self)
-        preferences_action.setShortcut("Ctrl+,")
-        preferences_action.triggered.connect(self._on_settings)
-        settings_menu.addAction(preferences_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
+        for title, entries in self._MENUS:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                elif entry == self._THEME_SUBMENU:
+                    # Filled by _create_theme_menu once the theme controller exists
+                    self._theme_menu = menu.addMenu("&Theme")
+                else:
+                    label, shortcut, handler_name = entry
+                    action = QAction(label, self)
+                    if shortcut:
+                        action.setShortcut(shortcut)
+                    action.triggered.connect(getattr(self, handler_name))
+                    menu.addAction(action)
 
         return menubar
 
     def _create_theme_menu(self, theme_menu) -> None:
         """Create theme submenu with available themes."""
         theme_manager = self.application.theme_manager
+        theme_controller = self._theme_controller
         theme_action_group = QActionGroup(self)
         theme_action_group.setExclusive(True)
 
         self._theme_menu_actions = {}
 
-        # Access theme manager directly since controller isn't initialized yet
-        current_theme = theme_manager.get_current_theme()
-        current_theme_name = current_theme.name if current_theme else None
+        current_theme_name = theme_controller.get_current_theme_name()
+
+        get_theme_info = theme_controller.get_theme_info
+        add_to_group = theme_action_group.addAction
+        add_to_menu = theme_menu.addAction
 
-        for theme_name in theme_manager.list_themes():
-            theme_info = theme_manager.get_theme_info(theme_name)
-            display_name = (
-                theme_info.get("display_name", theme_name.replace("_", " ").title())
-                if theme_info
-                else theme_name.replace("_", " ").title()
-            )
+        for theme_name in theme_controller.list_themes():
+            theme_info = get_theme_info(theme_name)
+            display_name = theme_info.get("display_name") if theme_info else None
+            if not display_name:
+                display_name = theme_name.replace("_", " ").title()
 
             action = QAction(display_name, self)
             action.setCheckable(True)
@@ -376,26 +493,34 @@ class MainWindow(BaseWindow):
             if current_theme_name and current_theme_name == theme_name:
                 action.setChecked(True)
 
-            # Use lambda that will call controller method when it exists
-            action.triggered.connect(lambda checked, tn=theme_name: self._apply_theme(tn))
-
-            theme_action_group.addAction(action)
-            theme_menu.addAction(action)
+            add_to_group(action)
+            add_to_menu(action)
             self._theme_menu_actions[theme_name] = action
 
-        # Connect to theme manager's theme_changed signal
-        def update_theme_menu(new_theme_name: str):
-            for theme_name, action in self._theme_menu_actions.items():
-                action.setChecked(theme_name == new_theme_name)
+        # One connection for the whole group; the theme name travels in the action data
+        theme_action_group.triggered.connect(self._on_theme_action_triggered)
 
-        theme_manager.theme_changed.connect(update_theme_menu)
+        # Keep the menu checks and ping colors in sync with theme changes
+        theme_manager.theme_changed.connect(self._update_theme_menu)
+        theme_manager.theme_changed.connect(self._refresh_on_theme_change)
 
-        # Refresh server table when theme changes to update ping colors
-        def refresh_on_theme_change(new_theme_name: str):
-            if hasattr(self, '_server_table'):
-                self._server_table._refresh_table()
+    def _on_theme_action_triggered(self, action: QAction) -> None:
+        """Apply the theme named by a triggered theme menu action."""
+        self._apply_theme(action.data())
 
-        theme_manager.theme_changed.connect(refresh_on_theme_change)
+    def _update_theme_menu(self, new_theme_name: str) -> None:
+        """Check the theme menu action for the newly applied theme."""
+        action = self._theme_menu_actions.get(new_theme_name)
+        if action is not None:
+            action.setChecked(True)  # Exclusive group unchecks the rest
+        else:
+            for other in self._theme_menu_actions.values():
+                other.setChecked(False)
+
+    def _refresh_on_theme_change(self, _new_theme_name: str) -> None:
+        """Refresh the server table so ping colors follow the new theme."""
+        if hasattr(self, '_server_table'):
+            self._server_table._refresh_table()
 
     def _apply_theme(self, theme_name: str) -> None:
         """Apply theme (delegates to controller when available)."""
@@ -412,31 +537,28 @@ class MainWindow(BaseWindow):
             self._server_controller.set_current_game(None)
             self._server_controller.set_current_server(None)
 
-        generic_columns = [
-            ColumnDefinition("name", "Server Name", "stretch"),
-            ColumnDefinition("status", "Status", "content"),
-            ColumnDefinition("address", "Address", "content"),
-            ColumnDefinition("players", "Players", "content"),
-            ColumnDefinition("uptime", "Uptime", "content"),
-            ColumnDefinition("version", "Version", "content"),
-        ]
-
-        self._server_table.set_columns(generic_columns)
-        self._server_table.set_servers(self._server_service.get_servers())
+        self._server_table.set_columns(_ALL_SERVERS_COLUMNS)
+        self._server_table.update_servers(self._server_service.get_servers())
 
     def _on_servers_loaded(self, game_defs, server_defs) -> None:
         """Handle servers being loaded."""
-        games = [gd.to_game() for gd in game_defs]
-        self._sidebar.set_games(games, server_defs)
+        self._update_sidebar(game_defs, server_defs)
 
     def _on_server_deleted(self, server_id: str) -> None:
         """Handle server being deleted."""
-        self._server_controller.reload_servers()
+        self._refresh_current_view()
+
+    def _refresh_current_view(self) -> None:
+        """Re-show the servers of the current selection from in-memory state.
+
+        Columns are left as they are; only the rows are replaced.
+        """
         current_game = self._server_controller.get_current_game()
         if current_game:
-            self._on_game_selected(current_game.id)
+            servers = self._server_controller.filter_servers_by_game(current_game.id)
         else:
-            self._show_all_servers()
+            servers = self._server_service.get_servers()
+        self._server_table.update_servers(servers)
 
     def _on_all_servers_selected(self) -> None:
         """Handle all servers selection."""
@@ -446,24 +568,28 @@ class MainWindow(BaseWindow):
 
     def _on_game_selected(self, game_id: str) -> None:
         """Handle game selection."""
-        game_def = self._server_controller.get_game_by_id(game_id)
-        if not game_def:
-            return
-
-        self._server_controller.set_current_game(game_def)
-        self._server_table.set_columns(game_def.columns)
-        self._server_table.filter_by_game(self._server_service.get_servers(), game_id)
-        self._info_panel_controller.load_game_data(game_def)
+        self._show_game(game_id)
 
     def _on_version_selected(self, game_id: str, version_id: str) -> None:
         """Handle version selection."""
+        self._show_game(game_id, version_id)
+
+    def _show_game(self, game_id: str, version_id: str | None = None) -> None:
+        """Show a game's servers, optionally narrowed to one version, and its info.
+
+        Args:
+            game_id: Game ID
+            version_id: Optional version ID to filter by
+        """
         game_def = self._server_controller.get_game_by_id(game_id)
         if not game_def:
             return
 
         self._server_controller.set_current_game(game_def)
         self._server_table.set_columns(game_def.columns)
-        self._server_table.filter_by_game(self._server_service.get_servers(), game_id, version_id)
+        self._server_table.set_servers(
+            self._server_controller.filter_servers_by_game(game_id, version_id)
+        )
         self._info_panel_controller.load_game_data(game_def)
 
     def _on_server_selected(self, server_id: str) -> None:
@@ -491,16 +617,13 @@ class MainWindow(BaseWindow):
             self._notifications.error("Configuration Error", f"Game configuration not found for {server.game_id}")
             return
 
+        from pserver_manager.widgets.server_editor import ServerEditor
         editor = ServerEditor(server, game, self)
         if editor.exec():
             if editor.save_to_file():
                 self._notifications.success("Server Saved", f"'{server.name}' saved successfully")
-                self._server_controller.reload_servers()
-                current_game = self._server_controller.get_current_game()
-                if current_game:
-                    self._on_game_selected(current_game.id)
-                else:
-                    self._show_all_servers()
+                self._server_controller.reload_server(server_id)
+                self._refresh_current_view()
             else:
                 self._notifications.error("Save Failed", f"Failed to save server '{server.name}'")
 
@@ -546,7 +669,19 @@ class MainWindow(BaseWindow):
         self._notifications.info("Coming Soon", "Add server functionality coming soon")
 
     def _on_refresh(self) -> None:
-        """Handle refresh button click."""
+        """Handle refresh button click.
+
+        Repeated presses within the debounce interval share a single reload.
+        """
+        self._reload_timer.start()
+
+    def _do_reload(self) -> None:
+        """Reload all servers from disk and show them."""
+        if self._initial_load_helper.is_running:
+            # The startup load is still reading the same files; reload once it ends
+            self._reload_pending = True
+            self._notifications.info("Loading", "Servers are still loading; refreshing once done")
+            return
         self._server_controller.reload_servers()
         self._show_all_servers()
         self._notifications.success("Refreshed", "Server list refreshed")
@@ -555,13 +690,21 @@ class MainWindow(BaseWindow):
         """Handle ping servers action."""
         self._notifications.info("Pinging Servers", "Checking server status...")
         self._server_table.ping_servers()
-        self._notifications.success("Ping Complete", "Server status updated")
+
+    def _on_ping_finished(self, success: bool) -> None:
+        """Handle background ping completion."""
+        if success:
+            self._notifications.success("Ping Complete", "Server status updated")
 
     def _on_fetch_player_counts(self) -> None:
         """Handle fetch server info action."""
         self._notifications.info("Fetching Server Info", "Retrieving player counts, uptime, and more...")
         self._server_table.fetch_player_counts()
-        self._notifications.success("Fetch Complete", "Server information updated")
+
+    def _on_player_counts_finished(self, success: bool) -> None:
+        """Handle background server info fetch completion."""
+        if success:
+            self._notifications.success("Fetch Complete", "Server information updated")
 
     def _on_refresh_reddit(self) -> None:
         """Refresh Reddit data for currently selected server."""
@@ -613,17 +756,18 @@ class MainWindow(BaseWindow):
 
     def _on_settings(self) -> None:
         """Handle settings button click."""
+        from pserver_manager.widgets.preferences_dialog import PreferencesDialog
         dialog = PreferencesDialog(
             config_manager=self._config_manager,
             theme_manager=self.application.theme_manager,
             app_paths=self._app_paths,
             servers=self._server_service.get_servers(),
+            theme_controller=self._theme_controller,
             game_defs=self._server_service.get_games(),
             parent=self,
         )
         if dialog.exec():
-            config_file = self._app_paths.get_settings_file()
-            self._config_manager.save(config_file)
+            self._theme_controller.save_config()
             self._notifications.success("Settings Saved", "Your preferences have been saved")
 
     def _on_show_all(self) -> None:
@@ -638,12 +782,12 @@ class MainWindow(BaseWindow):
         """Check for updates on startup and show dialog if available."""
         try:
             if self._update_service.is_first_run():
-                print("Servers directory is empty - auto-importing bundled servers and themes...")
+                logger.info("Servers directory is empty - auto-importing bundled servers and themes...")
                 imported = self._update_service.import_all_new_servers()
-                print(f"Auto-imported {imported} bundled servers")
+                logger.info("Auto-imported %d bundled servers", imported)
 
                 imported_themes = self._update_service.import_all_new_themes()
-                print(f"Auto-imported {imported_themes} bundled themes")
+                logger.info("Auto-imported %d bundled themes", imported_themes)
 
                 if imported_themes > 0:
                     self._theme_controller.reload_themes()
@@ -652,9 +796,16 @@ class MainWindow(BaseWindow):
                 self._show_all_servers()
                 return
 
-            update_info = self._update_service.check_for_updates()
+            # Hashing every bundled and user config is file I/O; keep it off the GUI thread
+            self._update_check_helper.run_task(self._update_service.check_for_updates)
+        except Exception as e:
+            logger.error("Error checking for updates: %s", e)
 
+    def _on_startup_update_check_finished(self, update_info) -> None:
+        """Show the update dialog once the background update check completes."""
+        try:
             if self._update_service.has_updates(update_info):
+                from pserver_manager.widgets.update_dialog import UpdateDialog
                 dialog = UpdateDialog(update_info, self._update_service.get_update_checker(), self)
                 if dialog.exec():
                     self._server_controller.reload_servers()
@@ -669,7 +820,11 @@ class MainWindow(BaseWindow):
 
                     self._notifications.success("Updates Applied", "Configurations updated")
         except Exception as e:
-            print(f"Error checking for updates: {e}")
+            logger.error("Error checking for updates: %s", e)
+
+    def _on_startup_update_check_error(self, error: str) -> None:
+        """Handle a failed background update check."""
+        logger.error("Error checking for updates: %s", error)
 
     def check_for_updates_manual(self) -> None:
         """Manually check for updates."""
@@ -677,6 +832,7 @@ class MainWindow(BaseWindow):
             update_info = self._update_service.check_for_updates()
 
             if self._update_service.has_updates(update_info):
+                from pserver_manager.widgets.update_dialog import UpdateDialog
                 dialog = UpdateDialog(update_info, self._update_service.get_update_checker(), self)
                 if dialog.exec():
                     self._server_controller.reload_servers()
@@ -736,6 +892,9 @@ class MainWindow(BaseWindow):
         cache_entry.reddit_posts = result.reddit_posts
         cache_entry.reddit_error = result.reddit_error
         cache_entry.updates = result.updates
+        cache_entry.updates_dicts = (
+            [update.to_dict() for update in result.updates] if result.updates is not None else None
+        )
         cache_entry.updates_error = result.updates_error
 
         # Update server table if scraping data is available
@@ -744,14 +903,12 @@ class MainWindow(BaseWindow):
 
         # Update ping if available
         if result.ping_success:
-            for server in self._server_service.get_servers():
-                if server.id == server_id:
-                    server.ping_ms = result.ping_ms
-                    if result.worlds_data is not None:
-                        if 'worlds' in server.data:
-                            server.data['worlds'] = result.worlds_data
-                    break
-            self._server_table._refresh_table()
+            server = self._server_service.get_server_by_id(server_id)
+            if server:
+                server.ping_ms = result.ping_ms
+                if result.worlds_data is not None and 'worlds' in server.data:
+                    server.data['worlds'] = result.worlds_data
+            self._server_table.schedule_refresh()
 
     def _on_batch_scan_finished(self, all_results: dict) -> None:
         """Handle batch data fetch completion."""
@@ -770,49 +927,115 @@ class MainWindow(BaseWindow):
         """Handle scan error."""
         self._progress_bar.setVisible(False)
         self._status_label.setText(f"Scan error: {error}")
-        print(f"Batch scan error: {error}")
+        logger.error("Batch scan error: %s", error)
+
+
+def _preload_deferred_modules() -> None:
+    """Import deferred modules ahead of first use (runs in background thread)."""
+    for module_name in _DEFERRED_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+def _activate_plugins(plugin_manager: PluginManager, plugins: list) -> None:
+    """Load and activate discovered plugins.
+
+    Args:
+        plugin_manager: Plugin manager that discovered the plugins
+        plugins: Plugin metadata returned by discover_plugins()
+    """
+    for plugin_metadata in plugins:
+        logger.info("Found plugin: %s - %s", plugin_metadata.id, plugin_metadata.name)
+        plugin_manager.load_plugin(plugin_metadata.id)
+        plugin_manager.activate_plugin(plugin_metadata.id)
 
 
 def main() -> int:
     """Run the application."""
-    resource_manager = ResourceManager()
-    app_paths = get_app_paths()
-
-    resource_manager.add_search_path("themes", app_paths.get_themes_dir())
-    resource_manager.add_search_path("themes", Path("pserver_manager/themes"))
-    resource_manager.add_search_path("icons", Path("pserver_manager/icons"))
-    resource_manager.add_search_path("translations", Path("pserver_manager/translations"))
-
-    app = Application(
-        argv=sys.argv,
-        app_name="PServerManager",
-        org_name="PServerManager",
-        org_domain="pservermanager.local",
-        resource_manager=resource_manager,
-        included_themes=[],
-        excluded_themes=["monokai"],
-        include_auto_theme=False,
+    # Records go through a queue so startup never blocks on console writes.
+    # Debug output (batch scan and scraper progress) is only emitted when DEBUG is set
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    log_listener_started = False
+    # The QueueHandler formats records into record.msg before queueing them,
+    # so it must pass the bare message on; console_handler adds the prefix
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("DEBUG") else logging.INFO,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
 
-    app.setStyle("Fusion")
+    try:
+        # Overlap deferred imports with application and window construction
+        threading.Thread(target=_preload_deferred_modules, daemon=True).start()
+
+        resource_manager = ResourceManager()
+        app_paths = get_app_paths()
+
+        # The user themes directory may only be created (and filled with the
+        # bundled themes) by MainWindow on first run, so it is always registered
+        resource_manager.add_search_path("themes", app_paths.get_themes_dir())
+
+        # Bundled directories are fixed at install time; skip missing ones,
+        # since every search path is probed on each lookup
+        for kind, directory in (
+            ("themes", _THEMES_DIR),
+            ("icons", _ICONS_DIR),
+            ("translations", _TRANSLATIONS_DIR),
+        ):
+            if directory.is_dir():
+                resource_manager.add_search_path(kind, directory)
+
+        # Merge queued mouse-move/resize events so table scrolling stays responsive
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+
+        app = Application(
+            argv=sys.argv,
+            app_name="PServerManager",
+            org_name="PServerManager",
+            org_domain="pservermanager.local",
+            resource_manager=resource_manager,
+            included_themes=[],
+            excluded_themes=["monokai"],
+            include_auto_theme=False,
+        )
 
-    plugin_manager = PluginManager(application=app)
-    plugin_manager.add_plugin_path(Path("pserver_manager/plugins"))
+        app.setStyle("Fusion")
 
-    available_plugins = plugin_manager.discover_plugins()
-    for plugin_metadata in available_plugins:
-        print(f"Found plugin: {plugin_metadata.id} - {plugin_metadata.name}")
-        plugin_manager.load_plugin(plugin_metadata.id)
-        plugin_manager.activate_plugin(plugin_metadata.id)
+        # Discovery only reads manifests; loading and activation wait until the
+        # window has painted. Plugins touch the running application, so they stay
+        # on the GUI thread. Skip discovery entirely when there is nothing to scan.
+        plugin_manager = None
+        available_plugins = []
+        if _PLUGINS_DIR.is_dir():
+            plugin_manager = PluginManager(application=app)
+            plugin_manager.add_plugin_path(_PLUGINS_DIR)
+            available_plugins = plugin_manager.discover_plugins()
+
+        window = MainWindow(application=app)
+
+        saved_theme = window._config_manager.get("ui.theme", "nord")
+        app.theme_manager.set_theme(saved_theme)
 
-    window = MainWindow(application=app)
+        window.show()
 
-    saved_theme = window._config_manager.get("ui.theme", "nord")
-    app.theme_manager.set_theme(saved_theme)
+        # Console output starts once the window is up; earlier records were queued
+        log_listener.start()
+        log_listener_started = True
 
-    window.show()
+        if available_plugins:
+            QTimer.singleShot(0, lambda: _activate_plugins(plugin_manager, available_plugins))
 
-    return app.exec()
+        return app.exec()
+    finally:
+        # Flush whatever is still queued, including records from a failed startup
+        if not log_listener_started:
+            log_listener.start()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ class ServerStatus(Enum):
     STARTING = "starting"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameVersion:
     """Represents a game version or expansion."""
 
@@ -25,17 +25,17 @@ class GameVersion:
     icon: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Game:
     """Represents a game."""
 
     id: str
     name: str
     icon: str = ""
-    versions: list[GameVersion] = field(default_factory=list)
+    versions: tuple[GameVersion, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Server:
     """Represents a game server."""
 
@@ -60,3 +60,24 @@ class Server:
     def address(self) -> str:
         """Get full server address."""
         return f"{self.host}:{self.port}"
+
+
+@dataclass(slots=True)
+class UpdatesConfig:
+    """Settings for fetching a game's or server's updates feed."""
+
+    url: str
+    is_rss: bool = False
+    use_js: bool = False
+    selectors: dict[str, str] = field(default_factory=dict)
+    limit: int = 10
+    max_dropdown_options: int | None = None
+    forum_mode: bool = False
+    forum_pagination_selector: str = ".ipsPagination_next"
+    forum_page_limit: int = 1
+    fetch_thread_content: bool = False
+    thread_content_selector: str = ""
+    auto_detect_date: bool = False
+    wiki_mode: bool = False
+    wiki_update_link_selector: str = "a[href*='/wiki/Updates/']"
+    wiki_content_selector: str = ".mw-parser-output"
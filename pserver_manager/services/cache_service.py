@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from typing import Any
 
 
+# Maximum number of update feeds kept in memory (least recently used go first)
+_UPDATES_CACHE_SIZE = 64
+
+
 class ServerDataCache:
     """Cache entry for server data including Reddit, updates, ping, etc."""
 
@@ -25,6 +30,7 @@ class ServerDataCache:
         self.reddit_posts: list | None = None
         self.reddit_error: str | None = None
         self.updates: list | None = None
+        self.updates_dicts: list[dict] | None = None  # updates converted once for display
         self.updates_error: str | None = None
 
 
@@ -38,9 +44,10 @@ class CacheService:
             cache_hours: Number of hours to cache updates
         """
         self._server_data_cache: dict[str, ServerDataCache] = {}
-        self._updates_last_fetch: dict[str, float] = {}
-        self._updates_cache: dict[str, list[dict]] = {}
+        # url -> (monotonic fetch time in ns, updates), bounded LRU
+        self._updates_cache: OrderedDict[str, tuple[int, list[dict]]] = OrderedDict()
         self._cache_hours = cache_hours
+        self._cache_ns = cache_hours * 3600 * 1_000_000_000
 
     def get_server_data(self, server_id: str) -> ServerDataCache | None:
         """Get cached server data.
@@ -84,13 +91,11 @@ class CacheService:
         Returns:
             True if should fetch (cache expired or no cache), False otherwise
         """
-        if url not in self._updates_last_fetch:
+        entry = self._updates_cache.get(url)
+        if entry is None:
             return True
 
-        last_fetch = self._updates_last_fetch[url]
-        elapsed_hours = (time.time() - last_fetch) / 3600
-
-        return elapsed_hours >= self._cache_hours
+        return time.monotonic_ns() - entry[0] >= self._cache_ns
 
     def get_cached_updates(self, url: str) -> list[dict] | None:
         """Get cached updates for a URL.
@@ -101,7 +106,12 @@ class CacheService:
         Returns:
             Cached updates or None if not found
         """
-        return self._updates_cache.get(url)
+        entry = self._updates_cache.get(url)
+        if entry is None:
+            return None
+
+        self._updates_cache.move_to_end(url)
+        return entry[1]
 
     def cache_updates(self, url: str, updates: list[dict]) -> None:
         """Cache updates for a URL.
@@ -110,8 +120,10 @@ class CacheService:
             url: Updates URL
             updates: Updates to cache
         """
-        self._updates_cache[url] = updates
-        self._updates_last_fetch[url] = time.time()
+        self._updates_cache[url] = (time.monotonic_ns(), updates)
+        self._updates_cache.move_to_end(url)
+        if len(self._updates_cache) > _UPDATES_CACHE_SIZE:
+            self._updates_cache.popitem(last=False)
 
     def clear_server_cache(self, server_id: str) -> None:
         """Clear cache for a specific server.
@@ -129,16 +141,11 @@ class CacheService:
             url: Optional specific URL to clear, or None to clear all
         """
         if url:
-            if url in self._updates_cache:
-                del self._updates_cache[url]
-            if url in self._updates_last_fetch:
-                del self._updates_last_fetch[url]
+            self._updates_cache.pop(url, None)
         else:
             self._updates_cache.clear()
-            self._updates_last_fetch.clear()
 
     def clear_all(self) -> None:
         """Clear all caches."""
         self._server_data_cache.clear()
         self._updates_cache.clear()
-        self._updates_last_fetch.clear()
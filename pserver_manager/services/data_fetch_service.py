@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
 
-from pserver_manager.utils.qt_reddit_worker import RedditFetchHelper
-from pserver_manager.utils.qt_updates_worker import UpdatesFetchHelper
 from pserver_manager.utils.batch_scanner import BatchScanHelper
 
 if TYPE_CHECKING:
     from pserver_manager.config_loader import ServerDefinition
+    from pserver_manager.models import UpdatesConfig
+    from pserver_manager.utils.qt_reddit_worker import RedditFetchHelper
+    from pserver_manager.utils.qt_updates_worker import UpdatesFetchHelper
 
 
 class DataFetchService(QObject):
@@ -35,22 +37,40 @@ class DataFetchService(QObject):
         """Initialize data fetch service."""
         super().__init__()
 
-        # Initialize Reddit fetch helper
-        self._reddit_helper = RedditFetchHelper()
-        self._reddit_helper.finished.connect(self._on_reddit_fetched)
-        self._reddit_helper.error.connect(self._on_reddit_error)
-
-        # Initialize Updates fetch helper
-        self._updates_helper = UpdatesFetchHelper()
-        self._updates_helper.finished.connect(self._on_updates_fetched)
-        self._updates_helper.error.connect(self._on_updates_error)
-
         # Initialize batch scanner
         self._batch_scanner = BatchScanHelper()
-        self._batch_scanner.progress.connect(self.scan_progress.emit)
-        self._batch_scanner.data_complete.connect(self.server_data_complete.emit)
-        self._batch_scanner.finished.connect(self.batch_scan_finished.emit)
-        self._batch_scanner.error.connect(self.scan_error.emit)
+        self._batch_scanner.progress.connect(self.scan_progress)
+        self._batch_scanner.data_complete.connect(self.server_data_complete)
+        self._batch_scanner.finished.connect(self.batch_scan_finished)
+        self._batch_scanner.error.connect(self.scan_error)
+
+    @cached_property
+    def _reddit_helper(self) -> RedditFetchHelper:
+        """Reddit fetch helper, created on first use.
+
+        The scraper pulls in requests, so it is only imported once a game
+        with a subreddit is actually shown.
+        """
+        from pserver_manager.utils.qt_reddit_worker import RedditFetchHelper
+
+        helper = RedditFetchHelper()
+        helper.finished.connect(self.reddit_fetched)
+        helper.error.connect(self.reddit_error)
+        return helper
+
+    @cached_property
+    def _updates_helper(self) -> UpdatesFetchHelper:
+        """Updates fetch helper, created on first use.
+
+        The scraper pulls in requests, BeautifulSoup and Playwright, so it is
+        only imported once a server with an updates feed is actually shown.
+        """
+        from pserver_manager.utils.qt_updates_worker import UpdatesFetchHelper
+
+        helper = UpdatesFetchHelper()
+        helper.finished.connect(self.updates_fetched)
+        helper.error.connect(self.updates_error)
+        return helper
 
     def fetch_reddit_posts(self, subreddit: str, limit: int = 15, sort: str = "hot") -> None:
         """Fetch Reddit posts for a subreddit.
@@ -62,59 +82,28 @@ class DataFetchService(QObject):
         """
         self._reddit_helper.start_fetching(subreddit, limit=limit, sort=sort)
 
-    def fetch_updates(
-        self,
-        url: str,
-        is_rss: bool,
-        use_js: bool,
-        selectors: dict,
-        limit: int = 10,
-        max_dropdown_options: int | None = None,
-        forum_mode: bool = False,
-        forum_pagination_selector: str = ".ipsPagination_next",
-        forum_page_limit: int = 1,
-        fetch_thread_content: bool = False,
-        thread_content_selector: str = "",
-        auto_detect_date: bool = False,
-        wiki_mode: bool = False,
-        wiki_update_link_selector: str = "a[href*='/wiki/Updates/']",
-        wiki_content_selector: str = ".mw-parser-output",
-    ) -> None:
+    def fetch_updates(self, config: UpdatesConfig) -> None:
         """Fetch server updates from a URL.
 
         Args:
-            url: Updates URL
-            is_rss: Whether URL is RSS feed
-            use_js: Whether to use JavaScript rendering
-            selectors: CSS selectors dict
-            limit: Number of updates to fetch
-            max_dropdown_options: Max dropdown options for dropdown-based changelogs
-            forum_mode: Whether to scrape forum threads (enables pagination)
-            forum_pagination_selector: CSS selector for next page link in forum mode
-            forum_page_limit: Maximum number of forum pages to scrape
-            fetch_thread_content: Whether to fetch full content from thread pages
-            thread_content_selector: CSS selector for content within thread page
-            auto_detect_date: If True, scan update content for dates if time selector fails
-            wiki_mode: Whether to scrape MediaWiki-based updates
-            wiki_update_link_selector: CSS selector for update page links in wiki mode
-            wiki_content_selector: CSS selector for content within wiki update pages
+            config: Updates fetch settings
         """
         self._updates_helper.start_fetching(
-            url=url,
-            is_rss=is_rss,
-            use_js=use_js,
-            selectors=selectors,
-            limit=limit,
-            max_dropdown_options=max_dropdown_options,
-            forum_mode=forum_mode,
-            forum_pagination_selector=forum_pagination_selector,
-            forum_page_limit=forum_page_limit,
-            fetch_thread_content=fetch_thread_content,
-            thread_content_selector=thread_content_selector,
-            auto_detect_date=auto_detect_date,
-            wiki_mode=wiki_mode,
-            wiki_update_link_selector=wiki_update_link_selector,
-            wiki_content_selector=wiki_content_selector,
+            url=config.url,
+            is_rss=config.is_rss,
+            use_js=config.use_js,
+            selectors=config.selectors,
+            limit=config.limit,
+            max_dropdown_options=config.max_dropdown_options,
+            forum_mode=config.forum_mode,
+            forum_pagination_selector=config.forum_pagination_selector,
+            forum_page_limit=config.forum_page_limit,
+            fetch_thread_content=config.fetch_thread_content,
+            thread_content_selector=config.thread_content_selector,
+            auto_detect_date=config.auto_detect_date,
+            wiki_mode=config.wiki_mode,
+            wiki_update_link_selector=config.wiki_update_link_selector,
+            wiki_content_selector=config.wiki_content_selector,
         )
 
     def start_batch_scan(self, servers: list[ServerDefinition], max_workers: int = 5) -> None:
@@ -129,35 +118,3 @@ class DataFetchService(QObject):
     def stop_batch_scan(self) -> None:
         """Stop current batch scanning operation."""
         self._batch_scanner.stop_fetch()
-
-    def _on_reddit_fetched(self, posts: list) -> None:
-        """Handle Reddit posts being fetched.
-
-        Args:
-            posts: List of RedditPost objects
-        """
-        self.reddit_fetched.emit(posts)
-
-    def _on_reddit_error(self, error: str) -> None:
-        """Handle Reddit fetch error.
-
-        Args:
-            error: Error message
-        """
-        self.reddit_error.emit(error)
-
-    def _on_updates_fetched(self, updates: list) -> None:
-        """Handle updates being fetched.
-
-        Args:
-            updates: List of update dictionaries
-        """
-        self.updates_fetched.emit(updates)
-
-    def _on_updates_error(self, error: str) -> None:
-        """Handle updates fetch error.
-
-        Args:
-            error: Error message
-        """
-        self.updates_error.emit(error)
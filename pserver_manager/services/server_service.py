@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pserver_manager.config_loader import ConfigLoader, GameDefinition, ServerDefinition
 
@@ -25,6 +26,9 @@ class ServerService:
         self._app_paths = app_paths
         self._game_defs: list[GameDefinition] = []
         self._all_servers: list[ServerDefinition] = []
+        self._servers_by_id: dict[str, ServerDefinition] = {}
+        self._servers_by_game: dict[str, list[ServerDefinition]] = {}
+        self._servers_by_version: dict[tuple[str, str], list[ServerDefinition]] = {}
 
     def load_all(self) -> tuple[list[GameDefinition], list[ServerDefinition]]:
         """Load all games and servers from configuration.
@@ -32,8 +36,28 @@ class ServerService:
         Returns:
             Tuple of (game_definitions, server_definitions)
         """
-        self._game_defs = self._config_loader.load_games()
-        self._all_servers = self._config_loader.load_servers()
+        # Build everything in locals first: this runs on a worker thread at
+        # startup while the GUI thread may already be reading the indexes
+        game_defs = self._config_loader.load_games()
+        all_servers = self._config_loader.load_servers()
+        servers_by_id = {server.id: server for server in all_servers}
+
+        # Index servers by game and (game, version) so sidebar filtering is a lookup
+        servers_by_game: dict[str, list[ServerDefinition]] = {}
+        servers_by_version: dict[tuple[str, str], list[ServerDefinition]] = {}
+        for server in all_servers:
+            servers_by_game.setdefault(server.game_id, []).append(server)
+            servers_by_version.setdefault((server.game_id, server.version_id), []).append(server)
+
+        # Publish the finished indexes together
+        (
+            self._game_defs,
+            self._all_servers,
+            self._servers_by_id,
+            self._servers_by_game,
+            self._servers_by_version,
+        ) = game_defs, all_servers, servers_by_id, servers_by_game, servers_by_version
+
         return self._game_defs, self._all_servers
 
     def get_games(self) -> list[GameDefinition]:
@@ -61,7 +85,8 @@ class ServerService:
         Returns:
             Game definition or None if not found
         """
-        return self._config_loader.get_game_by_id(game_id, self._game_defs)
+        # ConfigLoader indexes games by ID on every load_games() call
+        return self._config_loader.get_game_by_id(game_id)
 
     def get_server_by_id(self, server_id: str) -> ServerDefinition | None:
         """Get server definition by ID.
@@ -72,10 +97,55 @@ class ServerService:
         Returns:
             Server definition or None if not found
         """
-        for server in self._all_servers:
-            if server.id == server_id:
-                return server
-        return None
+        return self._servers_by_id.get(server_id)
+
+    def get_server_file(self, server: ServerDefinition) -> Path:
+        """Get the YAML file a server definition is stored in.
+
+        Args:
+            server: Server definition
+
+        Returns:
+            Path of the server's YAML file
+        """
+        server_file = self._config_loader.get_server_file(server.id)
+        if server_file is not None:
+            return server_file
+
+        # Server files are in servers/{game_id}/{server.filename}.yaml
+        return self._app_paths.get_servers_dir() / server.game_id / f"{server.filename}.yaml"
+
+    def reload_server(self, server_id: str) -> ServerDefinition | None:
+        """Re-read a single server file and update the in-memory indexes.
+
+        Args:
+            server_id: Server ID to reload
+
+        Returns:
+            Updated server definition or None if the server is unknown
+        """
+        old_server = self.get_server_by_id(server_id)
+        if not old_server:
+            return None
+
+        server_file = self.get_server_file(old_server)
+        new_server = self._config_loader.load_server_file(old_server.game_id, server_file)
+        if new_server.id != server_id:
+            # The file no longer describes the same server; rebuild from scratch
+            self.load_all()
+            return self.get_server_by_id(new_server.id)
+
+        self._servers_by_id[server_id] = new_server
+        self._replace_in(self._all_servers, old_server, new_server)
+        self._replace_in(self._servers_by_game.get(old_server.game_id, []), old_server, new_server)
+        old_key = (old_server.game_id, old_server.version_id)
+        new_key = (new_server.game_id, new_server.version_id)
+        if old_key == new_key:
+            self._replace_in(self._servers_by_version.get(old_key, []), old_server, new_server)
+        else:
+            self._remove_from_index(self._servers_by_version, old_key, old_server)
+            self._servers_by_version.setdefault(new_key, []).append(new_server)
+        return new_server
 
     def delete_server(self, server_id: str) -> bool:
         """Delete a server configuration file.
@@ -90,23 +160,56 @@ class ServerService:
         if not server:
             return False
 
+        server_file = self.get_server_file(server)
         try:
-            # Server files are in servers/{game_id}/{server_id}.yaml
-            # server.id is like "wow.retro-wow", extract just "retro-wow"
-            server_filename = server.id.split(".", 1)[1] if "." in server.id else server.id
-            servers_dir = self._app_paths.get_servers_dir()
-            server_file = servers_dir / server.game_id / f"{server_filename}.yaml"
-
-            if server_file.exists():
-                server_file.unlink()
-                return True
-            return False
-        except Exception:
+            os.unlink(server_file)
+        except OSError:  # Includes FileNotFoundError
             return False
 
-    def reload(self) -> None:
-        """Reload all games and servers from configuration."""
-        self.load_all()
+        self._config_loader.forget_server_file(server.game_id, server_file)
+        self._forget_server(server)
+        return True
+
+    def _forget_server(self, server: ServerDefinition) -> None:
+        """Drop a server from the in-memory indexes.
+
+        Args:
+            server: Server definition to remove
+        """
+        self._servers_by_id.pop(server.id, None)
+        if server in self._all_servers:
+            self._all_servers.remove(server)
+        self._remove_from_index(self._servers_by_game, server.game_id, server)
+        self._remove_from_index(self._servers_by_version, (server.game_id, server.version_id), server)
+
+    @staticmethod
+    def _replace_in(
+        servers: list[ServerDefinition], old_server: ServerDefinition, new_server: ServerDefinition
+    ) -> None:
+        """Replace a server in a list, keeping its position."""
+        for index, server in enumerate(servers):
+            if server is old_server:
+                servers[index] = new_server
+                return
+
+    @staticmethod
+    def _remove_from_index(index: dict, key: Any, server: ServerDefinition) -> None:
+        """Remove a server from an index bucket, dropping the bucket once empty."""
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        if server in bucket:
+            bucket.remove(server)
+        if not bucket:
+            del index[key]
+
+    def reload(self) -> tuple[list[GameDefinition], list[ServerDefinition]]:
+        """Reload all games and servers from configuration.
+
+        Returns:
+            Tuple of (game_definitions, server_definitions)
+        """
+        return self.load_all()
 
     def filter_servers_by_game(
         self, game_id: str, version_id: str | None = None
@@ -120,9 +223,6 @@ class ServerService:
         Returns:
             List of filtered server definitions
         """
-        filtered = [s for s in self._all_servers if s.game_id == game_id]
-
         if version_id:
-            filtered = [s for s in filtered if s.version_id == version_id]
-
-        return filtered
+            return list(self._servers_by_version.get((game_id, version_id), ()))
+        return list(self._servers_by_game.get(game_id, ()))
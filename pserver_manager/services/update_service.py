@@ -6,12 +6,19 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pserver_manager.utils import ServerUpdateChecker
+from pserver_manager.utils.paths import has_yaml_files
 
 if TYPE_CHECKING:
     from pserver_manager.utils.paths import AppPaths
     from pserver_manager.utils.updates import UpdateInfo
 
 
+# Bundled resources shipped inside the package
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_BUNDLED_SERVERS_DIR = _PACKAGE_DIR / "config" / "servers"
+_BUNDLED_THEMES_DIR = _PACKAGE_DIR / "themes"
+
+
 class UpdateService:
     """Service for managing bundled configuration updates."""
 
@@ -24,13 +31,17 @@ class UpdateService:
         self._app_paths = app_paths
 
         # Initialize update checker
-        bundled_servers_dir = Path(__file__).parent.parent / "config" / "servers"
+        bundled_servers_dir = _BUNDLED_SERVERS_DIR
         user_servers_dir = app_paths.get_servers_dir()
-        bundled_themes_dir = Path(__file__).parent.parent / "themes"
+        bundled_themes_dir = _BUNDLED_THEMES_DIR
         user_themes_dir = app_paths.get_themes_dir()
 
         self._update_checker = ServerUpdateChecker(
-            bundled_servers_dir, user_servers_dir, bundled_themes_dir, user_themes_dir
+            bundled_servers_dir,
+            user_servers_dir,
+            bundled_themes_dir,
+            user_themes_dir,
+            state_file=app_paths.get_cache_dir() / "update_fingerprint.json",
         )
 
     def check_for_updates(self) -> UpdateInfo:
@@ -82,9 +93,7 @@ class UpdateService:
         Returns:
             True if first run, False otherwise
         """
-        user_servers_dir = self._app_paths.get_servers_dir()
-        existing_files = list(user_servers_dir.rglob("*.yaml"))
-        return len(existing_files) == 0
+        return not has_yaml_files(self._app_paths.get_servers_dir())
 
     def get_update_checker(self) -> ServerUpdateChecker:
         """Get the underlying update checker instance.
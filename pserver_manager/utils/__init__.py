@@ -15,7 +15,12 @@ from pserver_manager.utils.server_scraper import (
     scrape_servers,
     scrape_servers_sync,
 )
-from pserver_manager.utils.svg_icon_loader import SvgIconLoader, get_svg_loader
+from pserver_manager.utils.svg_icon_loader import (
+    SvgIconLoader,
+    get_asset_icon,
+    get_brand_icon,
+    get_svg_loader,
+)
 
 # Qt integration (optional import)
 try:
@@ -47,4 +52,6 @@ __all__ = [
     "UpdateInfo",
     "SvgIconLoader",
     "get_svg_loader",
+    "get_asset_icon",
+    "get_brand_icon",
 ]
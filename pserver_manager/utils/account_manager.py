@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import yaml
 import base64
+import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 from dataclasses import dataclass, asdict
@@ -14,6 +15,12 @@ if TYPE_CHECKING:
     pass
 
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 @dataclass
 class ServerAccount:
     """Represents a server account."""
@@ -104,7 +111,7 @@ class AccountManager:
 
         try:
             with open(self.accounts_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
             # Convert dict to ServerAccount objects
             self._accounts = {}
@@ -113,7 +120,7 @@ class AccountManager:
                     ServerAccount(**account) for account in accounts_data
                 ]
         except Exception as e:
-            print(f"Error loading accounts: {e}")
+            logger.error("Error loading accounts: %s", e)
             self._accounts = {}
 
     def _save(self) -> None:
@@ -130,7 +137,7 @@ class AccountManager:
             with open(self.accounts_file, 'w', encoding='utf-8') as f:
                 yaml.dump(data, f, default_flow_style=False, sort_keys=False)
         except Exception as e:
-            print(f"Error saving accounts: {e}")
+            logger.error("Error saving accounts: %s", e)
 
     def get_accounts(self, server_id: str) -> list[ServerAccount]:
         """Get all accounts for a server.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import QObject, QThread, Signal
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
     from pserver_manager.config_loader import ServerDefinition
 
 
+logger = logging.getLogger(__name__)
+
+
 class ServerDataResult:
     """Complete data result for a server including scraping, ping, reddit, and updates."""
 
@@ -76,7 +80,7 @@ class BatchScanWorker(QObject):
         total_tasks = 0
         current_task = 0
 
-        print("[BatchScan] Starting batch data fetch...")
+        logger.debug("Starting batch data fetch...")
 
         # Count total tasks
         servers_with_scraping = [s for s in self.servers if s.scraping]
@@ -88,10 +92,10 @@ class BatchScanWorker(QObject):
         servers_with_reddit = [s for s in self.servers if s.reddit]
         servers_with_updates = [s for s in self.servers if s.updates_url]
 
-        print(f"[BatchScan] Found {len(servers_with_scraping)} servers with scraping")
-        print(f"[BatchScan] Found {len(servers_with_host)} servers with hosts")
-        print(f"[BatchScan] Found {len(servers_with_reddit)} servers with reddit")
-        print(f"[BatchScan] Found {len(servers_with_updates)} servers with updates")
+        logger.debug("Found %s servers with scraping", len(servers_with_scraping))
+        logger.debug("Found %s servers with hosts", len(servers_with_host))
+        logger.debug("Found %s servers with reddit", len(servers_with_reddit))
+        logger.debug("Found %s servers with updates", len(servers_with_updates))
 
         total_tasks = (
             len(servers_with_scraping)
@@ -100,10 +104,10 @@ class BatchScanWorker(QObject):
             + len(servers_with_updates)
         )
 
-        print(f"[BatchScan] Total tasks: {total_tasks}")
+        logger.debug("Total tasks: %s", total_tasks)
 
         if total_tasks == 0:
-            print("[BatchScan] No tasks to perform, finishing...")
+            logger.debug("No tasks to perform, finishing...")
             self.finished.emit(results)
             return
 
@@ -114,10 +118,10 @@ class BatchScanWorker(QObject):
         try:
             # 1. Scrape player counts/uptime for all servers with scraping config
             if servers_with_scraping and not self._cancelled:
-                print(f"[BatchScan] Starting scraping for {len(servers_with_scraping)} servers...")
+                logger.debug("Starting scraping for %s servers...", len(servers_with_scraping))
                 self.progress.emit(current_task, total_tasks, "Scraping player counts...")
                 scrape_results = scrape_servers_sync(servers_with_scraping, timeout=10.0)
-                print(f"[BatchScan] Scraping complete, got {len(scrape_results)} results")
+                logger.debug("Scraping complete, got %s results", len(scrape_results))
 
                 for server in servers_with_scraping:
                     if self._cancelled:
@@ -127,7 +131,7 @@ class BatchScanWorker(QObject):
                     if server.id in scrape_results:
                         scrape_result = scrape_results[server.id]
                         result.scrape_success = scrape_result.success
-                        print(f"[BatchScan] {server.name}: scrape_success={scrape_result.success}")
+                        logger.debug("%s: scrape_success=%s", server.name, scrape_result.success)
 
                         if scrape_result.success:
                             data = {}
@@ -140,22 +144,22 @@ class BatchScanWorker(QObject):
                             if scrape_result.uptime is not None:
                                 data['uptime'] = scrape_result.uptime
                             result.scrape_data = data
-                            print(f"[BatchScan] {server.name}: data={data}")
+                            logger.debug("%s: data=%s", server.name, data)
                         else:
                             result.scrape_error = scrape_result.error
-                            print(f"[BatchScan] {server.name}: error={scrape_result.error}")
+                            logger.warning("%s: error=%s", server.name, scrape_result.error)
                     else:
-                        print(f"[BatchScan] {server.name}: NO RESULT FOUND")
+                        logger.debug("%s: NO RESULT FOUND", server.name)
 
                     current_task += 1
                     self.progress.emit(current_task, total_tasks, f"Scraped {server.name}")
 
             # 2. Ping all servers with hosts (and worlds)
             if servers_with_host and not self._cancelled:
-                print(f"[BatchScan] Starting pinging for {len(servers_with_host)} servers...")
+                logger.debug("Starting pinging for %s servers...", len(servers_with_host))
                 self.progress.emit(current_task, total_tasks, "Pinging servers...")
                 ping_results = ping_multiple_servers_sync(servers_with_host, timeout=3.0)
-                print(f"[BatchScan] Pinging complete, got {len(ping_results)} results")
+                logger.debug("Pinging complete, got %s results", len(ping_results))
 
                 for server in servers_with_host:
                     if self._cancelled:
@@ -167,14 +171,14 @@ class BatchScanWorker(QObject):
                         status, latency_ms = ping_results[server.id]
                         result.ping_ms = latency_ms
                         result.ping_success = latency_ms >= 0
-                        print(f"[BatchScan] {server.name}: ping={latency_ms}ms, success={latency_ms >= 0}")
+                        logger.debug("%s: ping=%sms, success=%s", server.name, latency_ms, latency_ms >= 0)
                     else:
-                        print(f"[BatchScan] {server.name}: NO PING RESULT")
+                        logger.debug("%s: NO PING RESULT", server.name)
 
                     # Also ping individual worlds if they exist
                     worlds = server.get_field('worlds', [])
                     if isinstance(worlds, list) and len(worlds) > 0:
-                        print(f"[BatchScan] {server.name}: Found {len(worlds)} worlds to ping")
+                        logger.debug("%s: Found %s worlds to ping", server.name, len(worlds))
                         # Collect world hosts to ping
                         world_hosts = [world.get('host', '') for world in worlds if world.get('host')]
 
@@ -194,7 +198,7 @@ class BatchScanWorker(QObject):
                                     world['_ping_ms'] = ping_ms
                                     if status.name == 'ONLINE':
                                         online_count += 1
-                                    print(f"[BatchScan]   - {world.get('name', 'Unknown')}: {ping_ms}ms")
+                                    logger.debug("  - %s: %sms", world.get('name', 'Unknown'), ping_ms)
 
                             # Store worlds data in result
                             result.worlds_data = worlds
@@ -208,14 +212,14 @@ class BatchScanWorker(QObject):
                                     avg_ping = sum(online_pings) // len(online_pings)
                                     result.ping_ms = avg_ping
                                     result.ping_success = True
-                                    print(f"[BatchScan] {server.name}: {online_count}/{len(worlds)} worlds online, avg={avg_ping}ms")
+                                    logger.debug("%s: %s/%s worlds online, avg=%sms", server.name, online_count, len(worlds), avg_ping)
 
                     current_task += 1
                     self.progress.emit(current_task, total_tasks, f"Pinged {server.name}")
 
             # 3. Fetch Reddit posts for all servers with reddit
             if servers_with_reddit and not self._cancelled:
-                print(f"[BatchScan] Starting Reddit fetch for {len(servers_with_reddit)} servers...")
+                logger.debug("Starting Reddit fetch for %s servers...", len(servers_with_reddit))
                 reddit_scraper = RedditScraper()
 
                 for server in servers_with_reddit:
@@ -226,20 +230,20 @@ class BatchScanWorker(QObject):
                     result = results[server.id]
 
                     try:
-                        print(f"[BatchScan] Fetching Reddit for {server.name} (r/{server.reddit})...")
+                        logger.debug("Fetching Reddit for %s (r/%s)...", server.name, server.reddit)
                         posts = reddit_scraper.fetch_hot_posts(server.reddit, limit=15)
                         result.reddit_posts = posts
-                        print(f"[BatchScan] {server.name}: Got {len(posts)} Reddit posts")
+                        logger.debug("%s: Got %s Reddit posts", server.name, len(posts))
                     except Exception as e:
                         result.reddit_error = str(e)
-                        print(f"[BatchScan] {server.name}: Reddit error: {e}")
+                        logger.error("%s: Reddit error: %s", server.name, e)
 
                     current_task += 1
                     self.progress.emit(current_task, total_tasks, f"Fetched Reddit for {server.name}")
 
             # 4. Fetch updates for all servers with updates_url
             if servers_with_updates and not self._cancelled:
-                print(f"[BatchScan] Starting updates fetch for {len(servers_with_updates)} servers...")
+                logger.debug("Starting updates fetch for %s servers...", len(servers_with_updates))
                 updates_scraper = UpdatesScraper()
 
                 for server in servers_with_updates:
@@ -250,8 +254,8 @@ class BatchScanWorker(QObject):
                     result = results[server.id]
 
                     try:
-                        updates_limit = getattr(server, 'updates_limit', 10)
-                        print(f"[BatchScan] Fetching updates for {server.name} (limit={updates_limit}, url={server.updates_url})...")
+                        updates_limit = server.updates_limit
+                        logger.debug("Fetching updates for %s (limit=%s, url=%s)...", server.name, updates_limit, server.updates_url)
 
                         if server.updates_is_rss:
                             # RSS feed
@@ -285,32 +289,30 @@ class BatchScanWorker(QObject):
                                 limit=updates_limit,
                                 dropdown_selector=server.updates_selectors.get("dropdown"),
                                 max_dropdown_options=server.updates_max_dropdown_options,
-                                auto_detect_date=server.data.get('updates_auto_detect_date', False),
-                                wiki_mode=server.data.get('updates_wiki_mode', False),
-                                wiki_update_link_selector=server.data.get('updates_wiki_link_selector', "a[href*='/wiki/Updates/']"),
-                                wiki_content_selector=server.data.get('updates_wiki_content_selector', ".mw-parser-output"),
+                                auto_detect_date=server.updates_auto_detect_date,
+                                wiki_mode=server.updates_wiki_mode,
+                                wiki_update_link_selector=server.updates_wiki_link_selector,
+                                wiki_content_selector=server.updates_wiki_content_selector,
                             )
                         result.updates = updates
-                        print(f"[BatchScan] {server.name}: Got {len(updates)} updates")
+                        logger.debug("%s: Got %s updates", server.name, len(updates))
                     except Exception as e:
                         result.updates_error = str(e)
-                        print(f"[BatchScan] {server.name}: Updates error: {e}")
+                        logger.error("%s: Updates error: %s", server.name, e)
 
                     current_task += 1
                     self.progress.emit(current_task, total_tasks, f"Fetched updates for {server.name}")
 
             # Emit completion for each server
             if not self._cancelled:
-                print(f"[BatchScan] Emitting completion for {len(results)} servers...")
+                logger.debug("Emitting completion for %s servers...", len(results))
                 for server_id, result in results.items():
                     self.data_complete.emit(server_id, result)
 
-                print("[BatchScan] All done, emitting finished signal")
+                logger.debug("All done, emitting finished signal")
                 self.finished.emit(results)
         except Exception as e:
-            print(f"[BatchScan] EXCEPTION: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Batch scan failed")
             self.error.emit(f"Batch data fetch error: {e}")
 
 
@@ -347,10 +349,10 @@ class BatchScanHelper(QObject):
 
         # Connect signals
         self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self.progress.emit)
-        self.worker.data_complete.connect(self.data_complete.emit)
+        self.worker.progress.connect(self.progress)
+        self.worker.data_complete.connect(self.data_complete)
         self.worker.finished.connect(self._on_finished)
-        self.worker.error.connect(self.error.emit)
+        self.worker.error.connect(self.error)
 
         # Start thread
         self.thread.start()
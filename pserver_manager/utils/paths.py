@@ -8,10 +8,17 @@ Handles user data directories following OS conventions:
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
 import sys
+from collections import deque
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+
 class AppPaths:
     """Manages application paths following OS conventions."""
 
@@ -235,8 +242,10 @@ class AppPaths:
                     if game_dir.is_dir():
                         dest_game_dir = new_servers / game_dir.name
                         dest_game_dir.mkdir(parents=True, exist_ok=True)
-                        for server_file in game_dir.glob("*.yaml"):
-                            shutil.copy2(server_file, dest_game_dir / server_file.name)
+                        with os.scandir(game_dir) as entries:
+                            for entry in entries:
+                                if entry.name.endswith(".yaml") and entry.is_file():
+                                    shutil.copy2(entry.path, dest_game_dir / entry.name)
 
             # Migrate icons from bundled assets to user directory
             bundled_assets_dir = self.get_app_install_dir() / "pserver_manager" / "assets"
@@ -276,11 +285,14 @@ class AppPaths:
             bundled_themes_dir = self.get_app_install_dir() / "pserver_manager" / "themes"
             if bundled_themes_dir.exists():
                 user_themes_dir = self.get_themes_dir()
-                for theme_file in bundled_themes_dir.glob("*.yaml"):
-                    dest_theme = user_themes_dir / theme_file.name
-                    # Only copy if theme doesn't exist (don't overwrite user customizations)
-                    if not dest_theme.exists():
-                        shutil.copy2(theme_file, dest_theme)
+                with os.scandir(bundled_themes_dir) as entries:
+                    for entry in entries:
+                        if not (entry.name.endswith(".yaml") and entry.is_file()):
+                            continue
+                        dest_theme = user_themes_dir / entry.name
+                        # Only copy if theme doesn't exist (don't overwrite user customizations)
+                        if not dest_theme.exists():
+                            shutil.copy2(entry.path, dest_theme)
 
             # Migrate settings
             old_settings = old_config_dir / "settings.yaml"
@@ -289,7 +301,7 @@ class AppPaths:
 
             return True
         except Exception as e:
-            print(f"Migration failed: {e}")
+            logger.error("Migration failed: %s", e)
             return False
 
     def get_path_info(self) -> dict[str, str]:
@@ -325,3 +337,74 @@ def get_app_paths() -> AppPaths:
     if _app_paths is None:
         _app_paths = AppPaths()
     return _app_paths
+
+
+def first_yaml(directory: Path) -> Path | None:
+    """Find any YAML file in a directory tree.
+
+    Walks breadth-first with os.scandir and a plain suffix check, stopping
+    at the first match instead of materializing an rglob.
+
+    Args:
+        directory: Directory to search recursively
+
+    Returns:
+        Path of the first .yaml file found, or None if there is none
+    """
+    pending = deque([directory])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".yaml") and entry.is_file():
+                        return Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+    return None
+
+
+def yaml_tree_digest(directory: Path) -> str:
+    """Fingerprint the YAML files in a directory tree without reading them.
+
+    The digest covers every YAML file's path, mtime and size, so adding,
+    removing, renaming or editing a file changes it, including files copied
+    in with an older timestamp.
+
+    Args:
+        directory: Directory to walk
+
+    Returns:
+        Hex digest of the tree; a missing directory gives the empty-tree digest
+    """
+    files = []
+    pending = deque([directory])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".yaml"):
+                        stat = entry.stat()
+                        files.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path, mtime_ns, size in sorted(files):
+        digest.update(f"{path}:{mtime_ns}:{size}\n".encode())
+    return digest.hexdigest()
+
+
+def has_yaml_files(directory: Path) -> bool:
+    """Check whether a directory tree contains any YAML file.
+
+    Args:
+        directory: Directory to search recursively
+
+    Returns:
+        True if at least one .yaml file exists under directory
+    """
+    return first_yaml(directory) is not None
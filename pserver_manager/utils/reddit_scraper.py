@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -10,6 +11,9 @@ from typing import Any
 import requests
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class RedditPost:
     """Represents a Reddit post."""
@@ -99,10 +103,10 @@ class RedditScraper:
 
             return posts
         except requests.RequestException as e:
-            print(f"Error fetching Reddit posts: {e}")
+            logger.error("Error fetching Reddit posts: %s", e)
             return []
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error parsing Reddit response: {e}")
+            logger.error("Error parsing Reddit response: %s", e)
             return []
 
     def fetch_new_posts(self, subreddit: str, limit: int = 10) -> list[RedditPost]:
@@ -142,8 +146,8 @@ class RedditScraper:
 
             return posts
         except requests.RequestException as e:
-            print(f"Error fetching Reddit posts: {e}")
+            logger.error("Error fetching Reddit posts: %s", e)
             return []
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error parsing Reddit response: {e}")
+            logger.error("Error parsing Reddit response: %s", e)
             return []
@@ -5,6 +5,7 @@ Uses qtframework's ConfigValidator to detect and fix outdated schemas.
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,9 @@ from typing import Any
 import yaml
 from qtframework.config import ConfigValidator
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ServerSchemaMigrator:
     """Handles schema migrations for server configurations."""
@@ -191,7 +195,7 @@ class ServerSchemaMigrator:
         try:
             # Load current data
             with open(server_file, "r", encoding="utf-8") as f:
-                server_data = yaml.safe_load(f)
+                server_data = yaml.load(f, Loader=_YAML_LOADER)
 
             # Check if migration needed
             if not self.needs_migration(server_data):
@@ -253,13 +257,19 @@ class ServerSchemaMigrator:
                 continue
 
             # Scan all server YAML files in this game
-            for server_file in game_dir.glob("*.yaml"):
+            with os.scandir(game_dir) as entries:
+                server_files = [
+                    game_dir / entry.name
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
+            for server_file in server_files:
                 report["total_scanned"] += 1
 
                 # Load and check if migration needed
                 try:
                     with open(server_file, "r", encoding="utf-8") as f:
-                        server_data = yaml.safe_load(f)
+                        server_data = yaml.load(f, Loader=_YAML_LOADER)
 
                     if self.needs_migration(server_data):
                         report["needs_migration"] += 1
@@ -203,7 +203,7 @@ class ServerScraper:
         import time
 
         # Support both 'scraping' and 'player_count' (backward compatibility)
-        scraping_config = server.data.get("scraping") or server.data.get("player_count")
+        scraping_config = server.scraping or server.get_field("player_count", None)
         if not scraping_config:
             return ServerScrapeResult(error="No scraping config found")
 
@@ -224,7 +224,7 @@ class ServerScraper:
                 return cached_result
 
         # Get default URL and settings
-        default_url = scraping_config.get("url") or server.data.get("website")
+        default_url = scraping_config.get("url") or server.get_field("website", None)
         if not default_url:
             return ServerScrapeResult(error="No URL configured")
 
@@ -145,6 +145,11 @@ class SvgIconLoader:
 # Global instance
 _svg_loader: SvgIconLoader | None = None
 
+# Resolved asset icons keyed by relative path; None records a missing file
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+_asset_icons: dict[str, QIcon | None] = {}
+_brand_icons: dict[str, QIcon | None] = {}
+
 
 def get_svg_loader() -> SvgIconLoader:
     """Get the global SVG icon loader instance.
@@ -160,3 +165,63 @@ def get_svg_loader() -> SvgIconLoader:
         theme_manager = getattr(app, "theme_manager", None) if app else None
         _svg_loader = SvgIconLoader(theme_manager)
     return _svg_loader
+
+
+def get_asset_icon(icon: str) -> QIcon | None:
+    """Get a game, version or server icon, resolving its file once.
+
+    The user icons directory takes precedence over the bundled assets.
+
+    Args:
+        icon: Icon path relative to the icons directory
+
+    Returns:
+        Cached QIcon, or None if the icon file does not exist
+    """
+    try:
+        return _asset_icons[icon]
+    except KeyError:
+        pass
+
+    from pserver_manager.utils.paths import get_app_paths
+
+    user_icon_path = get_app_paths().get_icons_dir() / icon
+    icon_path = user_icon_path if user_icon_path.exists() else _ASSETS_DIR / icon
+    result = QIcon(str(icon_path)) if icon_path.exists() else None
+    _asset_icons[icon] = result
+    return result
+
+
+def get_brand_icon(svg_file: str, size: int = 16) -> QIcon | None:
+    """Get a brand icon scaled to size, loading it once.
+
+    Brand icons keep their original colors, unlike themed SVG icons.
+
+    Args:
+        svg_file: SVG file name in the bundled brands directory
+        size: Icon edge length in pixels
+
+    Returns:
+        Cached QIcon, or None if the SVG file does not exist
+    """
+    cache_key = f"{svg_file}@{size}"
+    try:
+        return _brand_icons[cache_key]
+    except KeyError:
+        pass
+
+    from PySide6.QtCore import Qt
+
+    svg_path = _ASSETS_DIR / "brands" / svg_file
+    result = None
+    if svg_path.exists():
+        pixmap = QPixmap(str(svg_path))
+        if pixmap.width() != size or pixmap.height() != size:
+            pixmap = pixmap.scaled(
+                size, size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+        result = QIcon(pixmap)
+    _brand_icons[cache_key] = result
+    return result
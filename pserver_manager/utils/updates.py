@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -10,6 +13,12 @@ from typing import Any
 import yaml
 
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 @dataclass
 class ServerMetadata:
     """Metadata for tracking server config updates."""
@@ -75,6 +84,7 @@ class ServerUpdateChecker:
         user_dir: Path,
         bundled_themes_dir: Path | None = None,
         user_themes_dir: Path | None = None,
+        state_file: Path | None = None,
     ):
         """Initialize update checker.
 
@@ -83,11 +93,14 @@ class ServerUpdateChecker:
             user_dir: Directory with user server configs
             bundled_themes_dir: Directory with bundled themes (optional)
             user_themes_dir: Directory with user themes (optional)
+            state_file: JSON file remembering per-file digests between checks (optional)
         """
         self.bundled_dir = bundled_dir
         self.user_dir = user_dir
         self.bundled_themes_dir = bundled_themes_dir
         self.user_themes_dir = user_themes_dir
+        self.state_file = state_file
+        self._digests: dict[str, list[Any]] | None = None
 
     @staticmethod
     def compute_content_hash(server_data: dict[str, Any]) -> str:
@@ -142,7 +155,7 @@ class ServerUpdateChecker:
             Tuple of (server_data, metadata)
         """
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         metadata = None
         if "_metadata" in data:
@@ -150,9 +163,111 @@ class ServerUpdateChecker:
 
         return data, metadata
 
+    @staticmethod
+    def _fingerprint_dir(directory: Path | None, max_depth: int = 0) -> dict[str, tuple[int, int]]:
+        """Collect the YAML files of a directory with their modification time and size.
+
+        Args:
+            directory: Directory to walk (missing directories yield nothing)
+            max_depth: How many subdirectory levels to descend into
+
+        Returns:
+            Mapping of POSIX-style relative path to (mtime_ns, size)
+        """
+        fingerprint: dict[str, tuple[int, int]] = {}
+        if directory is None:
+            return fingerprint
+
+        pending = [(str(directory), "", 0)]
+        while pending:
+            path, prefix, depth = pending.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if depth < max_depth:
+                                pending.append((entry.path, f"{prefix}{entry.name}/", depth + 1))
+                        elif entry.name.endswith(".yaml") and entry.is_file():
+                            stat = entry.stat()
+                            fingerprint[prefix + entry.name] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return fingerprint
+
+    def _load_digests(self) -> dict[str, list[Any]]:
+        """Load remembered file digests from the state file.
+
+        Returns:
+            Mapping of file path to [mtime_ns, size, content_hash, metadata, version]
+        """
+        if self._digests is None:
+            self._digests = {}
+            if self.state_file is not None:
+                try:
+                    with open(self.state_file, "r", encoding="utf-8") as f:
+                        state = json.load(f)
+                    if isinstance(state, dict):
+                        self._digests = state.get("files", {})
+                except (OSError, ValueError):
+                    pass
+        return self._digests
+
+    def _save_digests(self) -> None:
+        """Persist file digests so the next check only parses changed files."""
+        if self.state_file is None or self._digests is None:
+            return
+
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"files": self._digests}, f)
+            os.replace(tmp_file, self.state_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not save update state %s: %s", self.state_file, e)
+
+    def _digest_file(self, file_path: Path, key: tuple[int, int]) -> tuple[str, ServerMetadata | None, str]:
+        """Get the content hash, metadata and version of a YAML file.
+
+        Files whose (mtime_ns, size) match the remembered digest are not re-read.
+
+        Args:
+            file_path: YAML file
+            key: Current (mtime_ns, size) of the file
+
+        Returns:
+            Tuple of (content_hash, metadata, version)
+        """
+        digests = self._load_digests()
+        name = str(file_path)
+        cached = digests.get(name)
+        if cached is None or cached[:2] != list(key):
+            data, metadata = self.load_server_with_metadata(file_path)
+            cached = [
+                key[0],
+                key[1],
+                self.compute_content_hash(data),
+                metadata.to_dict() if metadata else None,
+                str(data.get("version", "1.0.0")),
+            ]
+            digests[name] = cached
+
+        metadata = ServerMetadata.from_dict(cached[3]) if cached[3] is not None else None
+        return cached[2], metadata, cached[4]
+
     def check_for_theme_updates(self) -> tuple[list[str], list[str], list[str]]:
         """Check for theme updates.
 
+        Returns:
+            Tuple of (new_themes, updated_themes, theme_conflicts)
+        """
+        result = self._check_themes()
+        self._save_digests()
+        return result
+
+    def _check_themes(self) -> tuple[list[str], list[str], list[str]]:
+        """Compare bundled themes against user themes.
+
         Returns:
             Tuple of (new_themes, updated_themes, theme_conflicts)
         """
@@ -164,46 +279,38 @@ class ServerUpdateChecker:
         if not self.bundled_themes_dir or not self.user_themes_dir:
             return new_themes, updated_themes, theme_conflicts
 
-        if not self.bundled_themes_dir.exists():
-            return new_themes, updated_themes, theme_conflicts
+        bundled_files = self._fingerprint_dir(self.bundled_themes_dir)
+        user_files = self._fingerprint_dir(self.user_themes_dir)
 
         # Get all bundled themes
-        for theme_file in self.bundled_themes_dir.glob("*.yaml"):
-            theme_name = theme_file.stem
-            user_theme_file = self.user_themes_dir / theme_file.name
-
-            # Load bundled theme
-            with open(theme_file, "r", encoding="utf-8") as f:
-                bundled_theme = yaml.safe_load(f)
-
-            bundled_version = bundled_theme.get("version", "1.0.0")
+        for file_name, bundled_key in bundled_files.items():
+            theme_name = file_name[: -len(".yaml")]
+            user_key = user_files.get(file_name)
 
-            if not user_theme_file.exists():
+            if user_key is None:
                 # New theme available
                 new_themes.append(theme_name)
-            else:
-                # Theme exists - check version and content
-                with open(user_theme_file, "r", encoding="utf-8") as f:
-                    user_theme = yaml.safe_load(f)
-
-                user_version = user_theme.get("version", "1.0.0")
-
-                # Check if content differs
-                bundled_hash = self.compute_content_hash(bundled_theme)
-                user_hash = self.compute_content_hash(user_theme)
-
-                if bundled_hash != user_hash:
-                    # Content differs - check if it's an update or user modification
-                    if bundled_version != user_version:
-                        # Versions differ - compare to see if bundled is newer
-                        if self._is_version_newer(bundled_version, user_version):
-                            updated_themes.append(theme_name)
-                        # else: user has newer/same version but different content (user customization)
-                    else:
-                        # Same version but different content
-                        # This is likely a bundled update (e.g., bug fix in same version)
-                        # Offer as update
+                continue
+
+            # Theme exists - check version and content
+            bundled_hash, _, bundled_version = self._digest_file(
+                self.bundled_themes_dir / file_name, bundled_key
+            )
+            user_hash, _, user_version = self._digest_file(self.user_themes_dir / file_name, user_key)
+
+            # Check if content differs
+            if bundled_hash != user_hash:
+                # Content differs - check if it's an update or user modification
+                if bundled_version != user_version:
+                    # Versions differ - compare to see if bundled is newer
+                    if self._is_version_newer(bundled_version, user_version):
                         updated_themes.append(theme_name)
+                    # else: user has newer/same version but different content (user customization)
+                else:
+                    # Same version but different content
+                    # This is likely a bundled update (e.g., bug fix in same version)
+                    # Offer as update
+                    updated_themes.append(theme_name)
 
         return new_themes, updated_themes, theme_conflicts
 
@@ -243,77 +350,69 @@ class ServerUpdateChecker:
         removed_servers = []
         conflicts = []
 
-        # Get all bundled servers
-        bundled_servers = {}
-        if self.bundled_dir.exists():
-            for game_dir in self.bundled_dir.iterdir():
-                if game_dir.is_dir():
-                    for server_file in game_dir.glob("*.yaml"):
-                        server_id = f"{game_dir.name}.{server_file.stem}"
-                        bundled_servers[server_id] = server_file
+        # One walk per directory; files are only parsed when their mtime or size changed
+        bundled_files = self._fingerprint_dir(self.bundled_dir, max_depth=1)
+        user_files = self._fingerprint_dir(self.user_dir, max_depth=1)
 
         # Check each bundled server against user directory
-        for server_id, bundled_file in bundled_servers.items():
-            game_id, server_name = server_id.split(".", 1)
-            user_file = self.user_dir / game_id / f"{server_name}.yaml"
+        for rel_path, bundled_key in bundled_files.items():
+            if "/" not in rel_path:
+                continue
+            server_id = rel_path[: -len(".yaml")].replace("/", ".", 1)
+            user_key = user_files.get(rel_path)
 
-            bundled_data, _ = self.load_server_with_metadata(bundled_file)
-            bundled_hash = self.compute_content_hash(bundled_data)
-
-            if not user_file.exists():
+            if user_key is None:
                 # New server available
                 new_servers.append(server_id)
-            else:
-                # Server exists in user directory - check for updates
-                user_data, user_metadata = self.load_server_with_metadata(user_file)
-                current_user_hash = self.compute_content_hash(user_data)
-
-                if user_metadata is None:
-                    # No metadata - legacy file (migrated from old location)
-                    # Since it matches a bundled server ID, treat as old bundled server
-                    # Compare hashes to detect if bundled version changed
-                    if bundled_hash != current_user_hash:
-                        # Bundled version changed - mark as update available
-                        updated_servers.append(server_id)
-                    continue
-
-                if user_metadata.source == "user":
-                    # User created their own server with same ID - potential conflict
-                    # Only flag if bundled version is different
-                    if bundled_hash != current_user_hash:
-                        conflicts.append(server_id)
-                    continue
-
-                # Bundled server - check if it's been updated
-                if bundled_hash != user_metadata.content_hash:
-                    # Check if user modified it
-                    if current_user_hash != user_metadata.content_hash:
-                        # User modified bundled server - conflict
-                        conflicts.append(server_id)
-                    else:
-                        # Clean update - bundled version changed, user didn't modify
-                        updated_servers.append(server_id)
+                continue
+
+            bundled_hash, _, _ = self._digest_file(self.bundled_dir / rel_path, bundled_key)
+
+            # Server exists in user directory - check for updates
+            current_user_hash, user_metadata, _ = self._digest_file(self.user_dir / rel_path, user_key)
+
+            if user_metadata is None:
+                # No metadata - legacy file (migrated from old location)
+                # Since it matches a bundled server ID, treat as old bundled server
+                # Compare hashes to detect if bundled version changed
+                if bundled_hash != current_user_hash:
+                    # Bundled version changed - mark as update available
+                    updated_servers.append(server_id)
+                continue
+
+            if user_metadata.source == "user":
+                # User created their own server with same ID - potential conflict
+                # Only flag if bundled version is different
+                if bundled_hash != current_user_hash:
+                    conflicts.append(server_id)
+                continue
+
+            # Bundled server - check if it's been updated
+            if bundled_hash != user_metadata.content_hash:
+                # Check if user modified it
+                if current_user_hash != user_metadata.content_hash:
+                    # User modified bundled server - conflict
+                    conflicts.append(server_id)
+                else:
+                    # Clean update - bundled version changed, user didn't modify
+                    updated_servers.append(server_id)
 
         # Check for removed servers (bundled servers in user dir that no longer exist in bundled)
-        if self.user_dir.exists():
-            for game_dir in self.user_dir.iterdir():
-                if game_dir.is_dir():
-                    for user_file in game_dir.glob("*.yaml"):
-                        server_id = f"{game_dir.name}.{user_file.stem}"
-
-                        # Skip if this server is in bundled (already handled above)
-                        if server_id in bundled_servers:
-                            continue
+        for rel_path, user_key in user_files.items():
+            # Skip if this server is in bundled (already handled above)
+            if "/" not in rel_path or rel_path in bundled_files:
+                continue
 
-                        # Check if this was a bundled server
-                        user_data, user_metadata = self.load_server_with_metadata(user_file)
+            # Check if this was a bundled server
+            _, user_metadata, _ = self._digest_file(self.user_dir / rel_path, user_key)
 
-                        if user_metadata and user_metadata.source == "bundled":
-                            # This was a bundled server but no longer exists in bundled configs
-                            removed_servers.append(server_id)
+            if user_metadata and user_metadata.source == "bundled":
+                # This was a bundled server but no longer exists in bundled configs
+                removed_servers.append(rel_path[: -len(".yaml")].replace("/", ".", 1))
 
         # Check for theme updates
-        new_themes, updated_themes, theme_conflicts = self.check_for_theme_updates()
+        new_themes, updated_themes, theme_conflicts = self._check_themes()
+        self._save_digests()
 
         return UpdateInfo(
             new_servers=new_servers,
@@ -360,7 +459,7 @@ class ServerUpdateChecker:
 
             return True
         except Exception as e:
-            print(f"Error importing server {server_id}: {e}")
+            logger.error("Error importing server %s: %s", server_id, e)
             return False
 
     def import_all_new_servers(self) -> int:
@@ -423,7 +522,7 @@ class ServerUpdateChecker:
 
             return True
         except Exception as e:
-            print(f"Error importing theme {theme_name}: {e}")
+            logger.error("Error importing theme %s: %s", theme_name, e)
             return False
 
     def update_theme(self, theme_name: str) -> bool:
@@ -492,5 +591,5 @@ class ServerUpdateChecker:
 
             return True
         except Exception as e:
-            print(f"Error removing server {server_id}: {e}")
+            logger.error("Error removing server %s: %s", server_id, e)
             return False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -26,6 +27,9 @@ except ImportError:
     CLOUDSCRAPER_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
+
 class UpdateNormalizer:
     """Utilities for normalizing update data to consistent formats."""
 
@@ -378,7 +382,7 @@ class UpdatesScraper:
             List of ServerUpdate objects aggregated from all dropdown options
         """
         if not PLAYWRIGHT_AVAILABLE:
-            print("Playwright not available. Install with: pip install playwright")
+            logger.warning("Playwright not available. Install with: pip install playwright")
             return []
 
         try:
@@ -401,13 +405,13 @@ class UpdatesScraper:
 
                 page.close()
 
-                print(f"Found {len(option_values)} dropdown options")
+                logger.debug("Found %s dropdown options", len(option_values))
 
                 # Limit number of options if specified
                 if max_dropdown_options:
                     option_values = option_values[:max_dropdown_options]
 
-                print(f"Processing {len(option_values)} options with {parallel_browsers} parallel browsers")
+                logger.debug("Processing %s options with %s parallel browsers", len(option_values), parallel_browsers)
 
                 all_updates = []
                 updates_lock = threading.Lock()
@@ -423,7 +427,7 @@ class UpdatesScraper:
                             page.goto(url, wait_until='networkidle', timeout=15000)
                             page.wait_for_timeout(500)
 
-                            print(f"Processing dropdown option {i+1}/{len(option_values)}: {value}")
+                            logger.debug("Processing dropdown option %s/%s: %s", i + 1, len(option_values), value)
 
                             # Select the option by value
                             page.select_option(dropdown_selector, value)
@@ -455,7 +459,7 @@ class UpdatesScraper:
                                 all_updates.extend(updates)
 
                     except Exception as e:
-                        print(f"Error processing dropdown option {i}: {e}")
+                        logger.error("Error processing dropdown option %s: %s", i, e)
 
                 # Process in parallel using thread pool
                 # Each thread has its own browser so no shared browser to close
@@ -465,7 +469,7 @@ class UpdatesScraper:
                 return all_updates
 
         except Exception as e:
-            print(f"Error fetching updates with dropdown: {e}")
+            logger.error("Error fetching updates with dropdown: %s", e)
             return []
 
     def fetch_updates_with_js(
@@ -497,7 +501,7 @@ class UpdatesScraper:
             List of ServerUpdate objects
         """
         if not PLAYWRIGHT_AVAILABLE:
-            print("Playwright not available. Install with: pip install playwright")
+            logger.warning("Playwright not available. Install with: pip install playwright")
             return []
 
         try:
@@ -517,7 +521,7 @@ class UpdatesScraper:
                     auto_detect_date=auto_detect_date
                 )
         except Exception as e:
-            print(f"Error fetching updates with JavaScript: {e}")
+            logger.error("Error fetching updates with JavaScript: %s", e)
             return []
 
     def _parse_updates_from_soup(
@@ -591,13 +595,13 @@ class UpdatesScraper:
                     # If exactly one date found, use it
                     if len(found_dates) == 1:
                         time_str = found_dates[0]
-                        print(f"Auto-detected date: {time_str}")
+                        logger.debug("Auto-detected date: %s", time_str)
                     elif len(found_dates) > 1:
                         # Multiple dates found - use the first parseable one
                         for date_candidate in found_dates:
                             if UpdateNormalizer.parse_date(date_candidate):
                                 time_str = date_candidate
-                                print(f"Auto-detected date (multiple found, using first valid): {time_str}")
+                                logger.debug("Auto-detected date (multiple found, using first valid): %s", time_str)
                                 break
 
                 # Extract preview
@@ -630,7 +634,7 @@ class UpdatesScraper:
                     )
                 )
             except Exception as e:
-                print(f"Error parsing update item: {e}")
+                logger.error("Error parsing update item: %s", e)
                 continue
 
         return updates
@@ -735,10 +739,10 @@ class UpdatesScraper:
                 auto_detect_date=auto_detect_date
             )
         except requests.RequestException as e:
-            print(f"Error fetching updates: {e}")
+            logger.error("Error fetching updates: %s", e)
             return []
         except Exception as e:
-            print(f"Error parsing updates: {e}")
+            logger.error("Error parsing updates: %s", e)
             return []
 
     def _fetch_thread_content(self, thread_url: str, content_selector: str) -> str:
@@ -762,7 +766,7 @@ class UpdatesScraper:
                 return content_elem.get_text(strip=True)
             return ""
         except Exception as e:
-            print(f"Error fetching thread content from {thread_url}: {e}")
+            logger.error("Error fetching thread content from %s: %s", thread_url, e)
             return ""
 
     def fetch_forum_threads(
@@ -805,11 +809,11 @@ class UpdatesScraper:
 
         while current_url and pages_scraped < page_limit and len(all_threads) < thread_limit:
             try:
-                print(f"Scraping forum page {pages_scraped + 1}: {current_url}")
+                logger.debug("Scraping forum page %s: %s", pages_scraped + 1, current_url)
 
                 if use_js:
                     if not PLAYWRIGHT_AVAILABLE:
-                        print("Playwright not available. Install with: pip install playwright")
+                        logger.warning("Playwright not available. Install with: pip install playwright")
                         break
 
                     with sync_playwright() as p:
@@ -827,7 +831,7 @@ class UpdatesScraper:
 
                 # Extract threads from current page
                 threads = soup.select(thread_selector)
-                print(f"Found {len(threads)} threads on page {pages_scraped + 1}")
+                logger.debug("Found %s threads on page %s", len(threads), pages_scraped + 1)
 
                 for thread in threads:
                     if len(all_threads) >= thread_limit:
@@ -863,7 +867,7 @@ class UpdatesScraper:
 
                         # Fetch full thread content if enabled
                         if fetch_thread_content and thread_content_selector and link:
-                            print(f"Fetching thread content from: {link}")
+                            logger.debug("Fetching thread content from: %s", link)
                             thread_content = self._fetch_thread_content(link, thread_content_selector)
                             if thread_content:
                                 preview = thread_content
@@ -893,7 +897,7 @@ class UpdatesScraper:
                             )
                         )
                     except Exception as e:
-                        print(f"Error parsing forum thread: {e}")
+                        logger.error("Error parsing forum thread: %s", e)
                         continue
 
                 pages_scraped += 1
@@ -921,13 +925,13 @@ class UpdatesScraper:
                     current_url = None  # Pagination not configured
 
             except requests.RequestException as e:
-                print(f"Error fetching forum page: {e}")
+                logger.error("Error fetching forum page: %s", e)
                 break
             except Exception as e:
-                print(f"Error parsing forum page: {e}")
+                logger.error("Error parsing forum page: %s", e)
                 break
 
-        print(f"Scraped {len(all_threads)} total threads from {pages_scraped} pages")
+        logger.debug("Scraped %s total threads from %s pages", len(all_threads), pages_scraped)
         return all_threads[:thread_limit]
 
     def fetch_rss_updates(self, rss_url: str, limit: int = 10) -> list[ServerUpdate]:
@@ -993,15 +997,15 @@ class UpdatesScraper:
                         )
                     )
                 except Exception as e:
-                    print(f"Error parsing RSS item: {e}")
+                    logger.error("Error parsing RSS item: %s", e)
                     continue
 
             return updates
         except requests.RequestException as e:
-            print(f"Error fetching RSS feed: {e}")
+            logger.error("Error fetching RSS feed: %s", e)
             return []
         except Exception as e:
-            print(f"Error parsing RSS feed: {e}")
+            logger.error("Error parsing RSS feed: %s", e)
             return []
 
     def fetch_wiki_updates(
@@ -1031,7 +1035,7 @@ class UpdatesScraper:
             # Cloudscraper (if enabled) will handle Cloudflare automatically
             if use_js:
                 if not PLAYWRIGHT_AVAILABLE:
-                    print("Playwright not available. Install with: pip install playwright")
+                    logger.warning("Playwright not available. Install with: pip install playwright")
                     return []
 
                 with sync_playwright() as p:
@@ -1050,7 +1054,7 @@ class UpdatesScraper:
 
             # Find all update links
             update_links = soup.select(update_link_selector)
-            print(f"Found {len(update_links)} update links on wiki page")
+            logger.debug("Found %s update links on wiki page", len(update_links))
 
             updates = []
             for idx, link in enumerate(update_links[:limit]):
@@ -1073,7 +1077,7 @@ class UpdatesScraper:
                     # Get the link text as potential title
                     link_text = link.get_text(strip=True)
 
-                    print(f"Fetching wiki update from: {update_url}")
+                    logger.debug("Fetching wiki update from: %s", update_url)
 
                     # Fetch the update page content
                     if use_js:
@@ -1093,7 +1097,7 @@ class UpdatesScraper:
                     # Get the main content
                     content_elem = update_soup.select_one(update_content_selector)
                     if not content_elem:
-                        print(f"Warning: No content found for {update_url}")
+                        logger.warning("No content found for %s", update_url)
                         continue
 
                     # Remove table of contents and navigation elements
@@ -1122,14 +1126,14 @@ class UpdatesScraper:
                     )
 
                 except Exception as e:
-                    print(f"Error fetching wiki update page: {e}")
+                    logger.error("Error fetching wiki update page: %s", e)
                     continue
 
             return updates
 
         except requests.RequestException as e:
-            print(f"Error fetching wiki main page: {e}")
+            logger.error("Error fetching wiki main page: %s", e)
             return []
         except Exception as e:
-            print(f"Error parsing wiki updates: {e}")
+            logger.error("Error parsing wiki updates: %s", e)
             return []
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
 
 from qtframework.widgets import VBox
-from pserver_manager.utils.paths import get_app_paths
+from pserver_manager.utils.svg_icon_loader import get_asset_icon
 
 
 if TYPE_CHECKING:
@@ -64,6 +62,21 @@ class GameSidebar(VBox):
             servers: Optional list of servers to filter versions (only show versions with servers)
         """
         self._games = {game.id: game for game in games}
+
+        # Rebuild without emitting selection/expansion signals for every item
+        was_blocked = self._tree.blockSignals(True)
+        try:
+            self._populate_tree(games, servers)
+        finally:
+            self._tree.blockSignals(was_blocked)
+
+    def _populate_tree(self, games: list[Game], servers: list | None) -> None:
+        """Rebuild the tree items for the given games.
+
+        Args:
+            games: List of games to display
+            servers: Optional list of servers to filter versions
+        """
         self._tree.clear()
 
         # Build set of version IDs that have servers
@@ -83,13 +96,9 @@ class GameSidebar(VBox):
 
             # Set game icon if available
             if game.icon:
-                # Try user icons directory first, fall back to bundled
-                user_icon_path = get_app_paths().get_icons_dir() / game.icon
-                bundled_icon_path = Path(__file__).parent.parent / "assets" / game.icon
-
-                icon_path = user_icon_path if user_icon_path.exists() else bundled_icon_path
-                if icon_path.exists():
-                    game_item.setIcon(0, QIcon(str(icon_path)))
+                icon = get_asset_icon(game.icon)
+                if icon is not None:
+                    game_item.setIcon(0, icon)
 
             # Add versions as children if they exist
             if game.versions:
@@ -107,13 +116,9 @@ class GameSidebar(VBox):
 
                     # Set version icon if available
                     if version.icon:
-                        # Try user icons directory first, fall back to bundled
-                        user_version_icon_path = get_app_paths().get_icons_dir() / version.icon
-                        bundled_version_icon_path = Path(__file__).parent.parent / "assets" / version.icon
-
-                        version_icon_path = user_version_icon_path if user_version_icon_path.exists() else bundled_version_icon_path
-                        if version_icon_path.exists():
-                            version_item.setIcon(0, QIcon(str(version_icon_path)))
+                        version_icon = get_asset_icon(version.icon)
+                        if version_icon is not None:
+                            version_item.setIcon(0, version_icon)
 
                     game_item.addChild(version_item)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
 import sys
@@ -35,9 +36,13 @@ from qtframework.widgets.buttons import ButtonSize, ButtonVariant
 if TYPE_CHECKING:
     from qtframework.config import ConfigManager
 
+    from pserver_manager.controllers.theme_controller import ThemeController
     from pserver_manager.utils.paths import AppPaths
 
 
+logger = logging.getLogger(__name__)
+
+
 class PreferencesDialog(QDialog):
     """Preferences dialog with sidebar navigation."""
 
@@ -48,6 +53,7 @@ class PreferencesDialog(QDialog):
         app_paths: AppPaths,
         servers: list = None,
         game_defs: list = None,
+        theme_controller: ThemeController | None = None,
         parent=None,
     ) -> None:
         """Initialize preferences dialog.
@@ -58,13 +64,16 @@ class PreferencesDialog(QDialog):
             app_paths: Application paths manager
             servers: List of server definitions (for accounts page)
             game_defs: List of game definitions
+            theme_controller: Theme controller, used for its cached theme list and info
             parent: Parent widget
         """
         super().__init__(parent)
         self.config_manager = config_manager
         self.theme_manager = theme_manager
+        self.theme_controller = theme_controller
         self.app_paths = app_paths
         self.servers = servers or []
+        self._servers_by_id = {server.id: server for server in self.servers}
         self.game_defs = game_defs or []
 
         # Initialize search highlighter
@@ -626,11 +635,7 @@ class PreferencesDialog(QDialog):
         server_id, username = item.data(Qt.ItemDataRole.UserRole)
 
         # Find the server
-        server = None
-        for s in self.servers:
-            if s.id == server_id:
-                server = s
-                break
+        server = self._servers_by_id.get(server_id)
 
         if server:
             from pserver_manager.widgets.account_dialog import AccountDialog
@@ -1174,7 +1179,7 @@ class PreferencesDialog(QDialog):
             else:
                 subprocess.run(["xdg-open", str(path)])
         except Exception as e:
-            print(f"Could not open folder: {e}")
+            logger.warning("Could not open folder: %s", e)
 
     def _check_for_updates(self) -> None:
         """Check for server configuration updates."""
@@ -1182,20 +1187,30 @@ class PreferencesDialog(QDialog):
         if self.parent():
             self.parent().check_for_updates_manual()
 
+    def _theme_source(self):
+        """Get the object to query for themes.
+
+        Prefers the theme controller, which caches the theme list and info;
+        both expose the same list_themes()/get_theme_info() methods.
+        """
+        return self.theme_controller or self.theme_manager
+
     def _get_available_themes(self) -> list[str]:
         """Get list of available themes."""
-        if self.theme_manager:
-            return self.theme_manager.list_themes()
+        themes = self._theme_source()
+        if themes:
+            return themes.list_themes()
         return ["light", "dark"]
 
     def _get_theme_display_names(self) -> dict[str, str]:
         """Get mapping of theme IDs to display names."""
-        if not self.theme_manager:
+        themes = self._theme_source()
+        if not themes:
             return {"light": "Light", "dark": "Dark"}
 
         display_map = {}
-        for theme_name in self.theme_manager.list_themes():
-            theme_info = self.theme_manager.get_theme_info(theme_name)
+        for theme_name in themes.list_themes():
+            theme_info = themes.get_theme_info(theme_name)
             if theme_info:
                 display_name = theme_info.get("display_name", theme_name.replace("_", " ").title())
             else:
@@ -1214,7 +1229,7 @@ class PreferencesDialog(QDialog):
             try:
                 self.theme_manager.set_theme(new_theme)
             except Exception as e:
-                print(f"Error applying theme: {e}")
+                logger.error("Error applying theme: %s", e)
 
     def _on_config_changed(self) -> None:
         """Handle configuration changes."""
@@ -1239,15 +1254,8 @@ class PreferencesDialog(QDialog):
         Args:
             games_item: Games tree item to add WoW under
         """
-        from pserver_manager.config_loader import ConfigLoader
-
-        # Load servers from config
-        config_dir = Path(__file__).parent.parent / "config"
-        config_loader = ConfigLoader(
-            config_dir=config_dir,
-            servers_dir=self.app_paths.get_servers_dir(),
-        )
-        all_servers = config_loader.load_servers()
+        # The main window hands over its already loaded servers
+        all_servers = self.servers
 
         # Filter WoW servers
         wow_servers = [s for s in all_servers if s.game_id == "wow"]
@@ -1278,15 +1286,8 @@ class PreferencesDialog(QDialog):
         Args:
             games_item: Games tree item to add RuneScape under
         """
-        from pserver_manager.config_loader import ConfigLoader
-
-        # Load servers from config
-        config_dir = Path(__file__).parent.parent / "config"
-        config_loader = ConfigLoader(
-            config_dir=config_dir,
-            servers_dir=self.app_paths.get_servers_dir(),
-        )
-        all_servers = config_loader.load_servers()
+        # The main window hands over its already loaded servers
+        all_servers = self.servers
 
         # Filter RuneScape servers
         runescape_servers = [s for s in all_servers if s.game_id == "runescape"]
@@ -1352,7 +1353,7 @@ class PreferencesDialog(QDialog):
                 row.addWidget(field, stretch=1)
                 layout.addLayout(row)
 
-        add_info_field("Version", getattr(server, 'version_id', '').replace('_', ' ').title())
+        add_info_field("Version", server.version_id.replace('_', ' ').title())
         add_info_field("Realm Type", server.get_field('realm_type', ''))
         add_info_field("Rates", server.get_field('rates', ''))
         add_info_field("Population", server.get_field('population', ''))
@@ -1383,13 +1384,14 @@ class PreferencesDialog(QDialog):
         links_group = QGroupBox("Server Links")
         links_layout = QVBoxLayout()
 
-        add_info_field("Website", getattr(server, 'website', ''), links_layout)
+        add_info_field("Website", server.get_field('website', ''), links_layout)
 
-        if hasattr(server, 'discord') and server.discord:
-            add_info_field("Discord", f"https://discord.gg/{server.discord}", links_layout)
+        discord = server.get_field('discord', '')
+        if discord:
+            add_info_field("Discord", f"https://discord.gg/{discord}", links_layout)
 
-        add_info_field("Register URL", getattr(server, 'register_url', ''), links_layout)
-        add_info_field("Login URL", getattr(server, 'login_url', ''), links_layout)
+        add_info_field("Register URL", server.get_field('register_url', ''), links_layout)
+        add_info_field("Login URL", server.get_field('login_url', ''), links_layout)
 
         links_group.setLayout(links_layout)
         content_layout.addWidget(links_group)
@@ -1400,8 +1402,7 @@ class PreferencesDialog(QDialog):
 
         add_info_field("Host", server.host, realmlist_layout)
 
-        if hasattr(server, 'realm_name') and server.realm_name:
-            add_info_field("Realm Name", server.realm_name, realmlist_layout)
+        add_info_field("Realm Name", server.get_field('realm_name', ''), realmlist_layout)
 
         realmlist_group.setLayout(realmlist_layout)
         content_layout.addWidget(realmlist_group)
@@ -1588,11 +1589,12 @@ class PreferencesDialog(QDialog):
             content_layout.addWidget(links_group)
 
         # Downloads section
-        if server.data.get("downloads"):
+        downloads = server.get_field("downloads", None)
+        if downloads:
             downloads_group = QGroupBox("Client Downloads")
             downloads_layout = QVBoxLayout()
 
-            for download in server.data["downloads"]:
+            for download in downloads:
                 download_row = QHBoxLayout()
 
                 label = QLabel(download["name"])
@@ -1734,7 +1736,7 @@ class PreferencesDialog(QDialog):
 
         for server_id, changes in self._server_field_changes.items():
             # Find the server to get its game_id
-            server = next((s for s in self.servers if s.id == server_id), None)
+            server = self._servers_by_id.get(server_id)
             if not server:
                 continue
 
@@ -1747,7 +1749,7 @@ class PreferencesDialog(QDialog):
             try:
                 # Load current YAML
                 with open(server_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
 
                 # Apply changes
                 for field_name, new_value in changes.items():
@@ -1758,4 +1760,4 @@ class PreferencesDialog(QDialog):
                     yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
             except Exception as e:
-                print(f"Error saving changes to {server_file}: {e}")
+                logger.error("Error saving changes to %s: %s", server_file, e)
@@ -14,6 +14,30 @@ if TYPE_CHECKING:
     from pserver_manager.config_loader import ServerDefinition
 
 
+# Display labels for statuses that are not shown as a ping time
+_STATUS_LABELS: dict[ServerStatus, str] = {
+    ServerStatus.OFFLINE: "Offline",
+    ServerStatus.MAINTENANCE: "Maintenance",
+    ServerStatus.STARTING: "Starting",
+}
+
+# (custom theme token, semantic fallback attribute) per non-online status
+_STATUS_COLOR_TOKENS: dict[ServerStatus, tuple[str, str]] = {
+    ServerStatus.OFFLINE: ("ping.offline", "feedback_error"),
+    ServerStatus.MAINTENANCE: ("server_status.maintenance", "feedback_warning"),
+    ServerStatus.STARTING: ("server_status.starting", "feedback_info"),
+}
+
+# (upper ping bound in ms, custom theme token, semantic fallback attribute) for online servers
+_PING_COLOR_TOKENS: tuple[tuple[float, str, str], ...] = (
+    (50, "ping.excellent", "feedback_success"),
+    (100, "ping.good", "feedback_success"),
+    (200, "ping.fair", "feedback_warning"),
+    (300, "ping.poor", "feedback_warning"),
+    (float("inf"), "ping.bad", "feedback_error"),
+)
+
+
 class ServerDataFormatter:
     """Formatter for server data display in table."""
 
@@ -70,14 +94,7 @@ class ServerDataFormatter:
 
         if status == ServerStatus.ONLINE and ping_ms >= 0:
             return f"{ping_ms}ms"
-        elif status == ServerStatus.OFFLINE:
-            return "Offline"
-        elif status == ServerStatus.MAINTENANCE:
-            return "Maintenance"
-        elif status == ServerStatus.STARTING:
-            return "Starting"
-        else:
-            return status.value
+        return _STATUS_LABELS.get(status, status.value)
 
     @staticmethod
     def set_status_color(
@@ -99,30 +116,23 @@ class ServerDataFormatter:
             if app and hasattr(app, "theme_manager"):
                 theme = app.theme_manager.get_current_theme()
                 if theme and theme.tokens:
-                    # Determine color based on status and ping using custom tokens
-                    if status == ServerStatus.OFFLINE:
-                        # Use custom ping.offline token, fallback to semantic
-                        color = theme.tokens.get_custom("ping.offline", theme.tokens.semantic.feedback_error)
-                    elif status == ServerStatus.MAINTENANCE:
-                        # Use custom server_status.maintenance or warning
-                        color = theme.tokens.get_custom("server_status.maintenance", theme.tokens.semantic.feedback_warning)
-                    elif status == ServerStatus.STARTING:
-                        # Use custom server_status.starting or info
-                        color = theme.tokens.get_custom("server_status.starting", theme.tokens.semantic.feedback_info)
-                    elif status == ServerStatus.ONLINE:
-                        # Color based on ping latency using custom ping tokens
-                        if ping_ms < 50:
-                            color = theme.tokens.get_custom("ping.excellent", theme.tokens.semantic.feedback_success)
-                        elif ping_ms < 100:
-                            color = theme.tokens.get_custom("ping.good", theme.tokens.semantic.feedback_success)
-                        elif ping_ms < 200:
-                            color = theme.tokens.get_custom("ping.fair", theme.tokens.semantic.feedback_warning)
-                        elif ping_ms < 300:
-                            color = theme.tokens.get_custom("ping.poor", theme.tokens.semantic.feedback_warning)
-                        else:
-                            color = theme.tokens.get_custom("ping.bad", theme.tokens.semantic.feedback_error)
+                    # Determine color based on status and ping using custom tokens,
+                    # falling back to the semantic feedback colors
+                    semantic = theme.tokens.semantic
+                    token = _STATUS_COLOR_TOKENS.get(status)
+                    if token is None and status == ServerStatus.ONLINE:
+                        # Color based on ping latency
+                        token = next(
+                            (custom, fallback)
+                            for limit, custom, fallback in _PING_COLOR_TOKENS
+                            if ping_ms < limit
+                        )
+
+                    if token is not None:
+                        custom, fallback = token
+                        color = theme.tokens.get_custom(custom, getattr(semantic, fallback))
                     else:
-                        color = theme.tokens.semantic.fg_primary
+                        color = semantic.fg_primary
 
                     # Set font color for this column
                     item.setForeground(column, QBrush(QColor(color)))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +29,9 @@ if TYPE_CHECKING:
     from pserver_manager.config_loader import GameDefinition, ServerDefinition
 
 
+logger = logging.getLogger(__name__)
+
+
 class ServerEditor(QDialog):
     """Dialog for editing server configuration based on game schema."""
 
@@ -231,12 +235,10 @@ class ServerEditor(QDialog):
             updated_data = {**self.server.data, **values}
 
             # Find the server's YAML file in user directory
-            # Server files are in servers/{game_id}/{server_id}.yaml
-            # server.id is like "wow.retro-wow", extract just "retro-wow"
-            server_filename = self.server.id.split(".", 1)[1] if "." in self.server.id else self.server.id
+            # Server files are in servers/{game_id}/{server.filename}.yaml
             app_paths = get_app_paths()
             servers_dir = app_paths.get_servers_dir()
-            server_file = servers_dir / self.server.game_id / f"{server_filename}.yaml"
+            server_file = servers_dir / self.server.game_id / f"{self.server.filename}.yaml"
 
             # Ensure directory exists
             server_file.parent.mkdir(parents=True, exist_ok=True)
@@ -247,5 +249,5 @@ class ServerEditor(QDialog):
 
             return True
         except Exception as e:
-            print(f"Error saving server config: {e}")
+            logger.error("Error saving server config: %s", e)
             return False
@@ -80,7 +80,7 @@ class ServerInfoCard:
             ServerInfoCard._create_links_card(server, layout, style)
 
         # Create rates card if available
-        rates_data = server.data.get("rates", {})
+        rates_data = server.get_field("rates", {})
         if rates_data and isinstance(rates_data, dict):
             ServerInfoCard._create_rates_card(rates_data, layout, style)
 
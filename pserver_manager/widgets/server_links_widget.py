@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import webbrowser
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton
 
+from pserver_manager.utils.svg_icon_loader import get_brand_icon
+
 if TYPE_CHECKING:
     from pserver_manager.config_loader import ServerDefinition
 
@@ -40,12 +40,6 @@ class ServerLinksWidget(QWidget):
         Args:
             server: Server definition
         """
-        from pserver_manager.utils.svg_icon_loader import get_svg_loader
-
-        # Get SVG icon loader
-        svg_loader = get_svg_loader()
-        brands_dir = Path(__file__).parent.parent / "assets" / "brands"
-
         # Define link types and their icons
         links = [
             ("🌐", None, server.get_field('website', ''), "Visit website"),
@@ -78,7 +72,7 @@ class ServerLinksWidget(QWidget):
 
         for emoji, svg_file, url, tooltip in links:
             if url:
-                btn = self._create_link_button(emoji, svg_file, url, tooltip, brands_dir)
+                btn = self._create_link_button(emoji, svg_file, url, tooltip)
                 self._layout.addWidget(btn)
 
         self._layout.addStretch()
@@ -89,7 +83,6 @@ class ServerLinksWidget(QWidget):
         svg_file: str | None,
         url: str,
         tooltip: str,
-        brands_dir: Path
     ) -> QPushButton:
         """Create a single link button.
 
@@ -98,7 +91,6 @@ class ServerLinksWidget(QWidget):
             svg_file: SVG file name to use for the button
             url: URL to open when clicked
             tooltip: Tooltip text
-            brands_dir: Directory containing brand SVG files
 
         Returns:
             Configured QPushButton
@@ -107,18 +99,9 @@ class ServerLinksWidget(QWidget):
 
         # Use SVG icon if available, otherwise use emoji
         if svg_file:
-            svg_path = brands_dir / svg_file
-            if svg_path.exists():
-                # Load icon without recoloring to preserve brand colors
-                pixmap = QPixmap(str(svg_path))
-                # Scale to 16x16 if needed
-                if pixmap.width() != 16 or pixmap.height() != 16:
-                    pixmap = pixmap.scaled(
-                        16, 16,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                icon = QIcon(pixmap)
+            # Brand icons are loaded once without recoloring to preserve brand colors
+            icon = get_brand_icon(svg_file, 16)
+            if icon is not None:
                 btn.setIcon(icon)
                 btn.setIconSize(QSize(16, 16))
             else:
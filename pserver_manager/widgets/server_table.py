@@ -4,10 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from pathlib import Path
-
-from PySide6.QtCore import Qt, QThread, Signal, QSize
-from PySide6.QtGui import QIcon, QColor
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, QSize
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
@@ -19,13 +17,39 @@ from PySide6.QtWidgets import (
 )
 
 
+# Maximum number of rows measured when sizing a column to its contents
+_RESIZE_CONTENTS_PRECISION = 200
+
+# Delay used to batch bursts of per-server updates into a single table rebuild
+_REFRESH_COALESCE_MS = 100
+
+
 class NumericTreeWidgetItem(QTreeWidgetItem):
-    """Tree widget item that sorts numerically when numeric data is available."""
+    """Tree widget item that sorts numerically when numeric data is available.
+
+    Numeric sort keys are kept in a plain Python dict on the item rather than
+    in a Qt data role, so comparisons during a sort avoid two QVariant
+    round-trips per call.
+    """
+
+    def __init__(self, *args) -> None:
+        """Initialize the item with no numeric sort keys."""
+        super().__init__(*args)
+        self._sort_keys: dict[int, float] = {}
+
+    def set_sort_key(self, column: int, value: float) -> None:
+        """Set the numeric value used when sorting by a column.
+
+        Args:
+            column: Column index
+            value: Numeric sort value
+        """
+        self._sort_keys[column] = float(value)
 
     def __lt__(self, other):
         """Compare items for sorting.
 
-        Uses numeric data (UserRole + 1) if available, otherwise falls back to text comparison.
+        Uses numeric sort keys if both items have one, otherwise falls back to text comparison.
         """
         # Safety check: ensure we have a tree widget
         tree = self.treeWidget()
@@ -36,23 +60,16 @@ class NumericTreeWidgetItem(QTreeWidgetItem):
         if column < 0:
             column = 0
 
-        # Try to get numeric sort data
-        try:
-            self_data = self.data(column, Qt.ItemDataRole.UserRole + 1)
-            other_data = other.data(column, Qt.ItemDataRole.UserRole + 1)
-
-            # If both have numeric data, compare numerically
-            if self_data is not None and other_data is not None:
-                return float(self_data) < float(other_data)
-        except (ValueError, TypeError, RuntimeError):
-            # Catch any Qt-related runtime errors
-            pass
+        # If both have numeric data, compare numerically
+        self_key = self._sort_keys.get(column)
+        other_keys = getattr(other, "_sort_keys", None)
+        other_key = other_keys.get(column) if other_keys else None
+        if self_key is not None and other_key is not None:
+            return self_key < other_key
 
         # Fall back to text comparison
         try:
-            self_text = self.text(column)
-            other_text = other.text(column)
-            return self_text < other_text
+            return self.text(column) < other.text(column)
         except (RuntimeError, AttributeError):
             return False
 
@@ -60,13 +77,17 @@ from qtframework.widgets import VBox
 from qtframework.widgets.badge import Badge, BadgeVariant
 from qtframework.widgets.advanced import ConfirmDialog
 from pserver_manager.models import ServerStatus
-from pserver_manager.utils import ping_multiple_servers_sync, ping_multiple_hosts_sync, scrape_servers_sync
-from pserver_manager.utils.paths import get_app_paths
+from pserver_manager.utils import ping_multiple_servers_sync, ping_multiple_hosts_sync
+from pserver_manager.utils.qt_background_worker import BackgroundHelper
+from pserver_manager.utils.qt_scraper_worker import AsyncScraperHelper
+from pserver_manager.utils.svg_icon_loader import get_asset_icon
 from pserver_manager.widgets.server_links_widget import ServerLinksWidget
 from pserver_manager.widgets.server_data_formatter import ServerDataFormatter
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pserver_manager.config_loader import ColumnDefinition, ServerDefinition
     from pserver_manager.models import ServerStatus
 
@@ -126,6 +147,34 @@ class ColoredTextDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
 
 
+def _ping_servers_and_worlds(
+    servers: list[ServerDefinition], timeout: float
+) -> tuple[dict[str, tuple[ServerStatus, int]], dict[str, tuple[ServerStatus, int]]]:
+    """Ping servers and all of their world hosts (runs in background thread).
+
+    Args:
+        servers: Servers to ping
+        timeout: Timeout in seconds for each ping
+
+    Returns:
+        Tuple of (results keyed by server ID, results keyed by world host)
+    """
+    ping_results = ping_multiple_servers_sync(servers, timeout=timeout)
+
+    # Ping every world host in one batch instead of one batch per server
+    world_hosts = []
+    for server in servers:
+        worlds = server.get_field('worlds', [])
+        if isinstance(worlds, list):
+            world_hosts.extend(world.get('host') for world in worlds if world.get('host'))
+    world_ping_results = (
+        ping_multiple_hosts_sync(list(dict.fromkeys(world_hosts)), timeout=timeout)
+        if world_hosts else {}
+    )
+
+    return ping_results, world_ping_results
+
+
 class ServerTable(VBox):
     """Table widget for displaying game servers."""
 
@@ -136,6 +185,8 @@ class ServerTable(VBox):
     manage_accounts_requested = Signal(str)  # server_id
     register_requested = Signal(str)  # server_id
     login_requested = Signal(str)  # server_id
+    ping_finished = Signal(bool)  # success
+    player_counts_finished = Signal(bool)  # success
 
     def __init__(self, parent=None) -> None:
         """Initialize the server table."""
@@ -143,7 +194,21 @@ class ServerTable(VBox):
 
         self._setup_ui()
         self._servers: list[ServerDefinition] = []
-        self._columns: list[ColumnDefinition] = []
+        self._servers_by_id: dict[str, ServerDefinition] = {}
+        self._columns: Sequence[ColumnDefinition] = ()
+        # Top-level row per server ID, and whether the rows predate set_columns()
+        self._items_by_id: dict[str, NumericTreeWidgetItem] = {}
+        self._columns_changed = False
+        self._ping_helper: BackgroundHelper | None = None
+        self._pinging_servers: list[ServerDefinition] = []
+        self._scrape_helper: AsyncScraperHelper | None = None
+        self._scraping_servers: list[ServerDefinition] = []
+
+        # Coalesces per-server updates (e.g. from a batch scan) into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(_REFRESH_COALESCE_MS)
+        self._refresh_timer.timeout.connect(self._refresh_table)
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -161,6 +226,10 @@ class ServerTable(VBox):
         self._table.setUniformRowHeights(False)  # Allow different row heights for widgets
         self._table.setAnimated(True)  # Smooth expand/collapse animation
 
+        # Bound how many rows resizeColumnToContents measures; Qt samples the
+        # visible rows first, so large lists no longer stringify every cell
+        self._table.header().setResizeContentsPrecision(_RESIZE_CONTENTS_PRECISION)
+
         # Install custom delegate to handle colored text
         self._table.setItemDelegate(ColoredTextDelegate(self._table))
 
@@ -172,12 +241,16 @@ class ServerTable(VBox):
 
         self.add_widget(self._table)
 
-    def set_columns(self, columns: list[ColumnDefinition]) -> None:
+    def set_columns(self, columns: Sequence[ColumnDefinition]) -> None:
         """Set the tree columns.
 
         Args:
-            columns: List of column definitions
+            columns: Column definitions (the same sequence again is a no-op)
         """
+        if columns is self._columns:
+            return
+        if [col.id for col in columns] != [col.id for col in self._columns]:
+            self._columns_changed = True
         self._columns = columns
         self._table.setColumnCount(len(columns))
         self._table.setHeaderLabels([col.label for col in columns])
@@ -196,40 +269,147 @@ class ServerTable(VBox):
             servers: List of server definitions to display
         """
         self._servers = servers
+        self._servers_by_id = {server.id: server for server in servers}
         self._refresh_table()
 
+    def update_servers(self, servers: list[ServerDefinition]) -> None:
+        """Show a new server list, touching only the rows that changed.
+
+        Rows are matched by server ID. Rows whose server is the same object
+        are left alone, so refreshes after an edit or delete don't rebuild
+        the whole tree. Falls back to set_servers() when the columns changed
+        or most rows differ.
+
+        Args:
+            servers: List of server definitions to display
+        """
+        new_by_id = {server.id: server for server in servers}
+        old_by_id = self._servers_by_id
+        changed = [
+            server for server in servers if old_by_id.get(server.id) is not server
+        ]
+        removed = [server_id for server_id in old_by_id if server_id not in new_by_id]
+
+        if (
+            self._columns_changed
+            or not self._items_by_id
+            or len(changed) + len(removed) > len(servers) // 2
+        ):
+            self.set_servers(servers)
+            return
+
+        self._servers = servers
+        self._servers_by_id = new_by_id
+        if not changed and not removed:
+            return
+
+        self._table.setSortingEnabled(False)
+        self._table.setUpdatesEnabled(False)
+        was_blocked = self._table.blockSignals(True)
+        try:
+            for server_id in removed:
+                self._take_server_item(server_id)
+
+            for server in changed:
+                index = self._take_server_item(server.id)
+                item, expanded = self._build_server_item(server)
+                if index < 0:
+                    self._table.addTopLevelItem(item)
+                else:
+                    self._table.insertTopLevelItem(index, item)
+                self._items_by_id[server.id] = item
+                self._attach_item_widgets(item, server, expanded)
+        finally:
+            self._table.blockSignals(was_blocked)
+            self._table.setUpdatesEnabled(True)
+
+        self._table.setSortingEnabled(True)
+
+    def _take_server_item(self, server_id: str) -> int:
+        """Remove a server's row from the tree.
+
+        Args:
+            server_id: Server ID whose row to remove
+
+        Returns:
+            Former top-level index of the row, or -1 if it wasn't shown
+        """
+        item = self._items_by_id.pop(server_id, None)
+        if item is None:
+            return -1
+        index = self._table.indexOfTopLevelItem(item)
+        if index >= 0:
+            self._table.takeTopLevelItem(index)
+        return index
+
+    def _build_server_item(self, server: ServerDefinition) -> tuple[NumericTreeWidgetItem, bool]:
+        """Build a detached tree item for a server, with one child per world.
+
+        Args:
+            server: Server definition
+
+        Returns:
+            Tuple of (item, whether it should be expanded once in the tree)
+        """
+        # Check if server has multiple worlds
+        worlds = server.get_field('worlds', [])
+        has_worlds = isinstance(worlds, list) and len(worlds) > 0
+
+        # Create parent item for the server (NumericTreeWidgetItem for sorting)
+        parent_item = NumericTreeWidgetItem()
+        self._populate_server_item(parent_item, server, is_parent=has_worlds)
+
+        # Add child items for each world if applicable
+        if has_worlds:
+            for world in worlds:
+                child_item = NumericTreeWidgetItem(parent_item)
+                self._populate_world_item(child_item, world, server)
+
+        return parent_item, has_worlds
+
+    def _attach_item_widgets(
+        self, item: NumericTreeWidgetItem, server: ServerDefinition, expanded: bool
+    ) -> None:
+        """Set up the parts of a row that need the item to be in the tree.
+
+        Args:
+            item: Top-level item already added to the tree
+            server: Server definition
+            expanded: Whether to expand the item
+        """
+        for col_idx, col in enumerate(self._columns):
+            if col.id == "links":
+                self._table.setItemWidget(item, col_idx, self._create_links_widget(server))
+
+        # Expand parents with worlds by default
+        if expanded:
+            item.setExpanded(True)
+
     def _refresh_table(self) -> None:
         """Refresh the tree with current servers."""
         if not self._columns:
             return  # No columns set yet
 
         self._table.setSortingEnabled(False)
-        self._table.clear()
-        self._table.setHeaderLabels([col.label for col in self._columns])
-
-        for server in self._servers:
-            # Check if server has multiple worlds
-            worlds = server.get_field('worlds', [])
-            has_worlds = isinstance(worlds, list) and len(worlds) > 0
-
-            # Create parent item for the server
-            if has_worlds:
-                # Server with multiple worlds - use NumericTreeWidgetItem for sorting
-                parent_item = NumericTreeWidgetItem(self._table)
-            else:
-                # Single world server
-                parent_item = NumericTreeWidgetItem(self._table)
-
-            self._populate_server_item(parent_item, server, is_parent=has_worlds)
+        # Suspend repaints and build detached items, then insert them in one batch.
+        # Signals are blocked so clearing the old rows does not fire selection handlers.
+        self._table.setUpdatesEnabled(False)
+        was_blocked = self._table.blockSignals(True)
+        try:
+            self._table.clear()
+            self._table.setHeaderLabels([col.label for col in self._columns])
 
-            # Add child items for each world if applicable
-            if has_worlds:
-                for world in worlds:
-                    child_item = NumericTreeWidgetItem(parent_item)
-                    self._populate_world_item(child_item, world, server)
+            items = [(self._build_server_item(server), server) for server in self._servers]
+            self._table.addTopLevelItems([item for (item, _), _ in items])
+            self._items_by_id = {server.id: item for (item, _), server in items}
+            self._columns_changed = False
 
-                # Expand parent by default
-                parent_item.setExpanded(True)
+            # Item widgets and expansion need the items to be in the tree
+            for (item, expanded), server in items:
+                self._attach_item_widgets(item, server, expanded)
+        finally:
+            self._table.blockSignals(was_blocked)
+            self._table.setUpdatesEnabled(True)
 
         # Re-enable sorting after all items are added
         self._table.setSortingEnabled(True)
@@ -255,7 +435,7 @@ class ServerTable(VBox):
                 current_width = header.sectionSize(stretch_column_idx)
                 header.resizeSection(stretch_column_idx, current_width + extra_width)
 
-    def _populate_server_item(self, item: QTreeWidgetItem, server: ServerDefinition, is_parent: bool = False) -> None:
+    def _populate_server_item(self, item: NumericTreeWidgetItem, server: ServerDefinition, is_parent: bool = False) -> None:
         """Populate a tree item with server data.
 
         Args:
@@ -264,10 +444,8 @@ class ServerTable(VBox):
             is_parent: Whether this is a parent item with child worlds
         """
         for col_idx, col in enumerate(self._columns):
-            # Handle links column specially with custom widget
+            # Links column gets a custom widget once the item is in the tree
             if col.id == "links":
-                links_widget = self._create_links_widget(server)
-                self._table.setItemWidget(item, col_idx, links_widget)
                 continue
 
             value = self._get_column_value(server, col.id)
@@ -279,16 +457,14 @@ class ServerTable(VBox):
 
                 # Add server icon if available
                 if server.icon:
-                    user_icon_path = get_app_paths().get_icons_dir() / server.icon
-                    bundled_icon_path = Path(__file__).parent.parent / "assets" / server.icon
-                    icon_path = user_icon_path if user_icon_path.exists() else bundled_icon_path
-                    if icon_path.exists():
-                        item.setIcon(0, QIcon(str(icon_path)))
+                    icon = get_asset_icon(server.icon)
+                    if icon is not None:
+                        item.setIcon(0, icon)
 
             # Set numeric sort data for players column
             if col.id == "players":
                 player_count = server.players if server.players != -1 else -1
-                item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, player_count)
+                item.set_sort_key(col_idx, player_count)
 
                 # Add tooltip for player count showing faction breakdown
                 if server.alliance_count is not None or server.horde_count is not None:
@@ -312,11 +488,11 @@ class ServerTable(VBox):
                     # Use average ping for sorting (or 0 if none online)
                     if online_worlds > 0:
                         avg_ping = sum(w.get('_ping_ms', 0) for w in worlds if w.get('_ping_status') == ServerStatus.ONLINE) // online_worlds
-                        item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, avg_ping)
+                        item.set_sort_key(col_idx, avg_ping)
                     else:
-                        item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, 999999)
+                        item.set_sort_key(col_idx, 999999)
                 else:
-                    item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, server.ping_ms if server.ping_ms != -1 else 999999)
+                    item.set_sort_key(col_idx, server.ping_ms if server.ping_ms != -1 else 999999)
 
             # Special formatting for certain columns
             if col.id in ["players", "uptime", "status"]:
@@ -329,7 +505,7 @@ class ServerTable(VBox):
                 if not (isinstance(worlds, list) and len(worlds) > 0):
                     self._set_status_color_inline_tree(item, col_idx, server.status, server.ping_ms)
 
-    def _populate_world_item(self, item: QTreeWidgetItem, world: dict, server: ServerDefinition) -> None:
+    def _populate_world_item(self, item: NumericTreeWidgetItem, world: dict, server: ServerDefinition) -> None:
         """Populate a tree item with world data.
 
         Args:
@@ -359,12 +535,12 @@ class ServerTable(VBox):
                 elif status == ServerStatus.ONLINE and ping_ms >= 0:
                     item.setText(col_idx, f"🟢 {ping_ms}ms")
                     # Set numeric sort data
-                    item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, ping_ms)
+                    item.set_sort_key(col_idx, ping_ms)
                     # Set status color
                     self._set_status_color_inline_tree(item, col_idx, status, ping_ms)
                 elif status == ServerStatus.OFFLINE:
                     item.setText(col_idx, "🔴 Offline")
-                    item.setData(col_idx, Qt.ItemDataRole.UserRole + 1, 9999)
+                    item.set_sort_key(col_idx, 9999)
                     self._set_status_color_inline_tree(item, col_idx, status, ping_ms)
 
                 item.setTextAlignment(col_idx, Qt.AlignmentFlag.AlignCenter)
@@ -459,12 +635,7 @@ class ServerTable(VBox):
             return
 
         # Find the server to check for URLs
-        server = None
-        for s in self._servers:
-            if s.id == server_id:
-                server = s
-                break
-
+        server = self._servers_by_id.get(server_id)
         if not server:
             return
 
@@ -527,72 +698,106 @@ class ServerTable(VBox):
         """
         if game_id is None:
             # Show all servers
-            self._servers = all_servers
+            self.set_servers(all_servers)
         else:
             # Filter servers
-            filtered = []
-            for server in all_servers:
-                if server.game_id == game_id:
-                    if version_id is None or server.version_id == version_id:
-                        filtered.append(server)
-            self._servers = filtered
-
-        self._refresh_table()
+            self.set_servers([
+                server for server in all_servers
+                if server.game_id == game_id
+                and (version_id is None or server.version_id == version_id)
+            ])
 
     def ping_servers(self) -> None:
-        """Ping all servers to update their status."""
+        """Ping all servers in the background to update their status.
+
+        Emits ping_finished once results have been applied to the table.
+        """
         if not self._servers:
+            self.ping_finished.emit(False)
             return
 
-        # Ping servers and get status + latency results
-        ping_results = ping_multiple_servers_sync(self._servers, timeout=3.0)
+        if self._ping_helper is None:
+            self._ping_helper = BackgroundHelper()
+            self._ping_helper.finished.connect(self._on_ping_results)
+            self._ping_helper.error.connect(self._on_ping_error)
+        elif self._ping_helper.is_running:
+            return  # A ping is already in flight
+
+        self._pinging_servers = list(self._servers)
+        self._ping_helper.run_task(_ping_servers_and_worlds, self._pinging_servers, 3.0)
+
+    def _on_ping_results(self, results: tuple[dict, dict]) -> None:
+        """Apply background ping results on the GUI thread.
+
+        Args:
+            results: Tuple of (server ID results, world host results)
+        """
+        ping_results, world_ping_results = results
 
         # Update server statuses and ping times
-        for server in self._servers:
+        for server in self._pinging_servers:
             if server.id in ping_results:
                 status, ping_ms = ping_results[server.id]
                 server.status = status
                 server.ping_ms = ping_ms
 
-            # Also ping individual worlds if they exist
+            # Store world ping results in the world dicts
             worlds = server.get_field('worlds', [])
-            if isinstance(worlds, list) and len(worlds) > 0:
-                # Collect world hosts to ping
-                world_hosts = [world.get('host', '') for world in worlds if world.get('host')]
-
-                if world_hosts:
-                    # Ping all world hosts
-                    world_ping_results = ping_multiple_hosts_sync(world_hosts, timeout=3.0)
-
-                    # Store ping results in the world dicts
-                    for world in worlds:
-                        world_host = world.get('host', '')
-                        if world_host and world_host in world_ping_results:
-                            status, ping_ms = world_ping_results[world_host]
-                            world['_ping_status'] = status
-                            world['_ping_ms'] = ping_ms
+            if isinstance(worlds, list):
+                for world in worlds:
+                    world_host = world.get('host', '')
+                    if world_host and world_host in world_ping_results:
+                        status, ping_ms = world_ping_results[world_host]
+                        world['_ping_status'] = status
+                        world['_ping_ms'] = ping_ms
+
+        self._pinging_servers = []
 
         # Refresh table to show updated statuses
         self._refresh_table()
+        self.ping_finished.emit(True)
+
+    def _on_ping_error(self, error: str) -> None:
+        """Handle a failed background ping.
+
+        Args:
+            error: Error message
+        """
+        self._pinging_servers = []
+        self.ping_finished.emit(False)
 
     def fetch_player_counts(self) -> None:
-        """Fetch player counts for all servers."""
-        if not self._servers:
-            return
+        """Fetch player counts for all servers in the background.
 
+        Emits player_counts_finished once results have been applied to the table.
+        """
         # Filter servers that have scraping config (support both new and old key names)
         servers_with_config = [
-            s for s in self._servers if s.data.get("scraping") or s.data.get("player_count")
+            s for s in self._servers if s.scraping or s.get_field("player_count", None)
         ]
 
         if not servers_with_config:
+            self.player_counts_finished.emit(False)
             return
 
-        # Scrape server information
-        scrape_results = scrape_servers_sync(servers_with_config, timeout=10.0)
+        if self._scrape_helper is None:
+            self._scrape_helper = AsyncScraperHelper()
+            self._scrape_helper.finished.connect(self._on_scrape_results)
+            self._scrape_helper.error.connect(self._on_scrape_error)
+        elif self._scrape_helper.is_running:
+            return  # A fetch is already in flight
+
+        self._scraping_servers = servers_with_config
+        self._scrape_helper.start_scraping(servers_with_config, timeout=10.0)
+
+    def _on_scrape_results(self, scrape_results: dict) -> None:
+        """Apply background scrape results on the GUI thread.
 
+        Args:
+            scrape_results: Mapping of server ID to scrape result
+        """
         # Update server player counts
-        for server in servers_with_config:
+        for server in self._scraping_servers:
             if server.id in scrape_results:
                 result = scrape_results[server.id]
                 if result.success:
@@ -606,8 +811,24 @@ class ServerTable(VBox):
                     server.alliance_count = result.alliance
                     server.horde_count = result.horde
 
+        self._scraping_servers = []
+
         # Refresh table to show updated counts
         self._refresh_table()
+        self.player_counts_finished.emit(True)
+
+    def _on_scrape_error(self, error: str) -> None:
+        """Handle a failed background scrape.
+
+        Args:
+            error: Error message
+        """
+        self._scraping_servers = []
+        self.player_counts_finished.emit(False)
+
+    def schedule_refresh(self) -> None:
+        """Refresh the table shortly, coalescing bursts of updates into one rebuild."""
+        self._refresh_timer.start()
 
     def update_server_data(self, server_id: str, data: dict) -> None:
         """Update a single server's data from scan results.
@@ -617,7 +838,7 @@ class ServerTable(VBox):
             data: Dictionary with scan data (total, alliance_count, horde_count, uptime)
         """
         # Find the server
-        server = next((s for s in self._servers if s.id == server_id), None)
+        server = self._servers_by_id.get(server_id)
         if not server:
             return
 
@@ -631,5 +852,5 @@ class ServerTable(VBox):
         if 'uptime' in data:
             server.uptime = data['uptime']
 
-        # Refresh table to show updated data
-        self._refresh_table()
+        # Many results arrive in a burst during a batch scan; rebuild once
+        self.schedule_refresh()
@@ -0,0 +1,60 @@
+"""
+Compile bundled game definitions into a Python module.
+
+Parses every YAML file in pserver_manager/config/games and writes the
+result to pserver_manager/_compiled_configs.py as plain Python literals,
+so packaged builds can import game definitions instead of parsing YAML
+on every startup. ConfigLoader falls back to YAML whenever the module is
+missing or older than any source file.
+
+Usage:
+    python scripts/compile_configs.py
+"""
+
+import pprint
+import sys
+from pathlib import Path
+
+import yaml
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "pserver_manager"
+GAMES_DIR = PACKAGE_DIR / "config" / "games"
+OUTPUT_FILE = PACKAGE_DIR / "_compiled_configs.py"
+
+HEADER = '''"""Compiled game definitions.
+
+Generated by scripts/compile_configs.py - do not edit by hand.
+"""
+
+'''
+
+
+def compile_games(games_dir: Path) -> dict[str, dict]:
+    """Parse all game definition files.
+
+    Args:
+        games_dir: Directory containing game YAML files
+
+    Returns:
+        Mapping of YAML file name to parsed game data
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    games = {}
+    for yaml_file in sorted(games_dir.glob("*.yaml")):
+        games[yaml_file.name] = yaml.load(yaml_file.read_bytes(), Loader=loader)
+    return games
+
+
+def main():
+    if not GAMES_DIR.exists():
+        print(f"Error: Directory not found: {GAMES_DIR}")
+        sys.exit(1)
+
+    games = compile_games(GAMES_DIR)
+    source = HEADER + f"GAMES = {pprint.pformat(games, width=120, sort_dicts=False)}\n"
+    OUTPUT_FILE.write_text(source, encoding="utf-8")
+    print(f"Compiled {len(games)} game definition(s) to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()